@@ -2,16 +2,14 @@
 Specific utilities for creating plots from GEOS-Chem benchmark simulations.
 """
 import os
-import gc
 import numpy as np
+from joblib import cpu_count
 from gcpy import util
+from gcpy.cstools import is_cubed_sphere
 from gcpy.plot.compare_single_level import compare_single_level
 from gcpy.benchmark.modules.benchmark_utils import \
-    get_lumped_species_definitions, make_output_dir, \
-    pdf_filename, print_sigdiffs, read_ref_and_dev
-
-# Suppress numpy divide by zero warnings to prevent output spam
-np.seterr(divide="ignore", invalid="ignore")
+    get_common_varnames, make_output_dir, pdf_filename, \
+    print_sigdiffs, read_ref_and_dev, same_ref_and_dev_files
 
 
 def make_benchmark_drydep_plots(
@@ -31,6 +29,7 @@ def make_benchmark_drydep_plots(
         n_job=-1,
         time_mean=False,
         varlist=None,
+        keep_fp64=False,
         spcdb_dir=os.path.join(os.path.dirname(__file__), "..", "..")
 ):
     """
@@ -89,6 +88,11 @@ def make_benchmark_drydep_plots(
         varlist: list of str
             List of variables to plot.  If varlist is None, then
             all common variables in Ref & Dev will be plotted.
+        keep_fp64: bool
+            Set this flag to True to plot the data in double precision.
+            Otherwise the data are converted to single precision
+            (which is how they are stored in GEOS-Chem diagnostics).
+            Default value: False
     """
 
     # Create directory for plots (if it doesn't exist)
@@ -99,11 +103,13 @@ def make_benchmark_drydep_plots(
         overwrite=overwrite,
     )
 
-    # Read data
+    # Read data (only the DryDepVel_* variables).  The time mean
+    # is taken below, once the variables to plot are known.
     refdata, devdata = read_ref_and_dev(
         ref,
         dev,
-        time_mean=time_mean
+        multi_file=time_mean,
+        prefix="DryDepVel_"
     )
 
     # Get common variables between Ref and Dev
@@ -114,6 +120,91 @@ def make_benchmark_drydep_plots(
             prefix="DryDepVel_",
             verbose=verbose
         )
+    else:
+        # Only DryDepVel_* variables are read, so skip any requested
+        # variables that are not present in both Ref and Dev
+        missing = [
+            var for var in varlist
+            if var not in refdata.data_vars or var not in devdata.data_vars
+        ]
+        if missing:
+            print(f"Skipping variables not in both Ref and Dev: {missing}")
+        varlist = [var for var in varlist if var not in missing]
+    if not varlist:
+        print("No DryDepVel_ variables to plot ... skipping drydep plots")
+        refdata.close()
+        devdata.close()
+        return
+
+    # Only the surface level (and first time slice) of the variables
+    # to plot is needed, so read just that into memory.  Select the
+    # variables before doing any other work (e.g. the time mean).
+    # DryDepVel_* fields have no missing values, so skip the NaN
+    # checks when averaging over time (uses a plain sum reduction).
+    # Use single precision unless requested otherwise, which halves
+    # the memory needed for regridding and plotting.
+    def surface_slice(dset):
+        dset = dset[varlist]
+        if time_mean:
+            dset = util.dataset_mean(dset, skipna=False)
+        dset = dset.isel(
+            {dim: 0 for dim in ("time", "lev") if dim in dset.dims}
+        ).load()
+        if not keep_fp64:
+            dset = dset.astype(np.float32)
+        return dset
+
+    # If Ref and Dev are the same file, only read the data once.
+    # (Use a shallow copy, which shares the data but not the
+    # Dataset and Variable objects.)
+    refdata_sfc = surface_slice(refdata)
+    if same_ref_and_dev_files(ref, dev):
+        devdata_sfc = refdata_sfc.copy(deep=False)
+    else:
+        devdata_sfc = surface_slice(devdata)
+        devdata.close()
+
+    # Close the underlying files
+    refdata.close()
+    del refdata
+    del devdata
+
+    # The whole globe is plotted, so the color bar limits of the Ref
+    # and Dev panels are the min and max of each variable.  Compute
+    # these for all variables at once instead of one at a time.
+    ref_vals = refdata_sfc[varlist].to_array().values
+    ref_vals = ref_vals.reshape(len(varlist), -1)
+    dev_vals = devdata_sfc[varlist].to_array().values
+    dev_vals = dev_vals.reshape(len(varlist), -1)
+    ref_min = np.nanmin(ref_vals, axis=1)
+    ref_max = np.nanmax(ref_vals, axis=1)
+    dev_min = np.nanmin(dev_vals, axis=1)
+    dev_max = np.nanmax(dev_vals, axis=1)
+    panel_limits = {
+        var: (float(ref_min[i]), float(ref_max[i]),
+              float(dev_min[i]), float(dev_max[i]))
+        for i, var in enumerate(varlist)
+    }
+    del ref_vals
+    del dev_vals
+
+    # compare_single_level renders one PDF page per variable in
+    # parallel.  Each worker must import GCPy and Matplotlib, so do
+    # not start more workers than there are variables to plot or
+    # physical cores (n_job < 0 follows the joblib convention).
+    if n_job < 0:
+        n_job = cpu_count(only_physical_cores=True) + 1 + n_job
+    n_job = max(1, min(n_job, len(varlist)))
+
+    # Rasterize the data layer of panels drawn with pcolormesh (i.e.
+    # cubed-sphere data), so that the PDF does not store every grid
+    # box as a vector path; axes and labels are still drawn as
+    # vectors.  Lat/lon panels are drawn with imshow, which already
+    # produces an image, so this has no effect on them.
+    plot_args = {}
+    if is_cubed_sphere(refdata_sfc) or is_cubed_sphere(devdata_sfc) or \
+       (cmpres is not None and "x" not in str(cmpres)):
+        plot_args["rasterized"] = True
 
     # Create surface plots
     sigdiff_list = []
@@ -123,28 +214,41 @@ def make_benchmark_drydep_plots(
         subdst,
         plot_type="Surface"
     )
-    compare_single_level(
-        refdata,
-        refstr,
-        devdata,
-        devstr,
-        varlist=varlist,
-        cmpres=cmpres,
-        ilev=0,
-        pdfname=pdfname,
-        log_color_scale=log_color_scale,
-        extra_title_txt=subdst,
-        sigdiff_list=sigdiff_list,
-        weightsdir=weightsdir,
-        n_job=n_job,
-        spcdb_dir=spcdb_dir
-    )
-    util.add_bookmarks_to_pdf(
-        pdfname,
-        varlist,
-        remove_prefix=collection + '_',
-        verbose=verbose
-    )
+
+    # Plots are only written to PDF, so have the parallel plotting
+    # workers (which import Matplotlib afresh) use the non-interactive
+    # Agg backend.  The caller's environment is restored afterwards,
+    # and the backend of this process is not changed.
+    mplbackend = os.environ.get("MPLBACKEND")
+    os.environ["MPLBACKEND"] = "Agg"
+
+    try:
+        # Suppress numpy divide by zero warnings to prevent output spam
+        with np.errstate(divide="ignore", invalid="ignore"):
+            compare_single_level(
+                refdata_sfc,
+                refstr,
+                devdata_sfc,
+                devstr,
+                varlist=varlist,
+                cmpres=cmpres,
+                ilev=0,
+                pdfname=pdfname,
+                log_color_scale=log_color_scale,
+                extra_title_txt=subdst,
+                sigdiff_list=sigdiff_list,
+                weightsdir=weightsdir,
+                n_job=n_job,
+                spcdb_dir=spcdb_dir,
+                bookmarks=[var.replace(collection + '_', '') for var in varlist],
+                panel_limits=panel_limits,
+                **plot_args
+            )
+    finally:
+        if mplbackend is None:
+            del os.environ["MPLBACKEND"]
+        else:
+            os.environ["MPLBACKEND"] = mplbackend
 
     # Write significant differences to file (if there are any)
     print_sigdiffs(
@@ -157,9 +261,8 @@ def make_benchmark_drydep_plots(
     # -------------------------------------------
     # Clean up
     # -------------------------------------------
-    del refdata
-    del devdata
-    gc.collect()
+    del refdata_sfc
+    del devdata_sfc
 
 
 def drydepvel_species():
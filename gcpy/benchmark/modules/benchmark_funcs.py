@@ -25,10 +25,8 @@ from gcpy.benchmark.modules.benchmark_utils import \
     archive_lumped_species_definitions, get_species_categories, \
     archive_species_categories, rename_speciesconc_to_speciesconcvv
 
-# Suppress numpy divide by zero warnings to prevent output spam
-np.seterr(divide="ignore", invalid="ignore")
-
 
+@np.errstate(divide="ignore", invalid="ignore")
 def create_total_emissions_table(
         refdata,
         refstr,
@@ -145,13 +143,7 @@ def create_total_emissions_table(
     # molecular weights), which we will need for unit conversions.
     # This is located in the "data" subfolder of this folder where
     # this benchmark.py file is found.
-    properties = util.read_config_file(
-        os.path.join(
-            spcdb_dir,
-            "species_database.yml"
-        ),
-        quiet=True
-    )
+    properties = util.read_species_database(spcdb_dir)
 
     # ==================================================================
     # Get the list of emission variables for which we will print totals
@@ -356,6 +348,7 @@ def create_total_emissions_table(
         width=TABLE_WIDTH
     )
 
+@np.errstate(divide="ignore", invalid="ignore")
 def create_global_mass_table(
         refdata,
         refstr,
@@ -435,13 +428,7 @@ def create_global_mass_table(
     # Load a YAML file containing species properties (such as
     # molecular weights), which we will need for unit conversions.
     # This is located in the "data" subfolder of this current directory.2
-    properties = util.read_config_file(
-        os.path.join(
-            spcdb_dir,
-            "species_database.yml"
-        ),
-        quiet=True
-    )
+    properties = util.read_species_database(spcdb_dir)
 
     # ==================================================================
     # Open file for output
@@ -584,6 +571,7 @@ def create_global_mass_table(
     )
 
 
+@np.errstate(divide="ignore", invalid="ignore")
 def create_mass_accumulation_table(
         refdatastart,
         refdataend,
@@ -677,13 +665,7 @@ def create_mass_accumulation_table(
     # Load a YAML file containing species properties (such as
     # molecular weights), which we will need for unit conversions.
     # This is located in the "data" subfolder of this current directory.2
-    properties = util.read_config_file(
-        os.path.join(
-            spcdb_dir,
-            "species_database.yml"
-        ),
-        quiet=True
-    )
+    properties = util.read_species_database(spcdb_dir)
 
     # ==================================================================
     # Open file for output
@@ -866,6 +848,7 @@ def create_mass_accumulation_table(
     )
 
 
+@np.errstate(divide="ignore", invalid="ignore")
 def make_benchmark_conc_plots(
         ref,
         refstr,
@@ -1263,6 +1246,7 @@ def make_benchmark_conc_plots(
     dict_500 = {}
     dict_zm = {}
 
+    @np.errstate(divide="ignore", invalid="ignore")
     def createplots(filecat):
         cat_diff_dict = {'sfc': [], '500': [], 'zm': []}
 
@@ -1556,6 +1540,7 @@ def make_benchmark_conc_plots(
     gc.collect()
 
 
+@np.errstate(divide="ignore", invalid="ignore")
 def make_benchmark_emis_plots(
         ref,
         refstr,
@@ -1999,6 +1984,7 @@ def make_benchmark_emis_plots(
     gc.collect()
 
 
+@np.errstate(divide="ignore", invalid="ignore")
 def make_benchmark_emis_tables(
         reflist,
         refstr,
@@ -2184,6 +2170,7 @@ def make_benchmark_emis_tables(
     gc.collect()
 
 
+@np.errstate(divide="ignore", invalid="ignore")
 def make_benchmark_jvalue_plots(
         ref,
         refstr,
@@ -2589,6 +2576,7 @@ def make_benchmark_jvalue_plots(
     gc.collect()
 
 
+@np.errstate(divide="ignore", invalid="ignore")
 def make_benchmark_aod_plots(
         ref,
         refstr,
@@ -2909,6 +2897,7 @@ def make_benchmark_aod_plots(
     gc.collect()
 
 
+@np.errstate(divide="ignore", invalid="ignore")
 def make_benchmark_mass_tables(
         ref,
         refstr,
@@ -3166,6 +3155,7 @@ def make_benchmark_mass_tables(
     gc.collect()
 
 
+@np.errstate(divide="ignore", invalid="ignore")
 def make_benchmark_mass_accumulation_tables(
         ref_start,
         ref_end,
@@ -3464,6 +3454,7 @@ def make_benchmark_mass_accumulation_tables(
     gc.collect()
 
 
+@np.errstate(divide="ignore", invalid="ignore")
 def make_benchmark_oh_metrics(
         ref,
         refmet,
@@ -3686,6 +3677,7 @@ def make_benchmark_oh_metrics(
     gc.collect()
 
 
+@np.errstate(divide="ignore", invalid="ignore")
 def make_benchmark_wetdep_plots(
         ref,
         refstr,
@@ -3960,6 +3952,7 @@ def make_benchmark_wetdep_plots(
     gc.collect()
 
 
+@np.errstate(divide="ignore", invalid="ignore")
 def make_benchmark_aerosol_tables(
         devdir,
         devlist_aero,
@@ -4015,13 +4008,7 @@ def make_benchmark_aerosol_tables(
     species_list = ["BCPI", "OCPI", "SO4", "DST1", "SALA", "SALC"]
 
     # Read the species database
-    spcdb = util.read_config_file(
-        os.path.join(
-            spcdb_dir,
-            "species_database.yml"
-        ),
-        quiet=True
-    )
+    spcdb = util.read_species_database(spcdb_dir)
 
     # Molecular weights [g mol-1], as taken from the species database
     mw = {}
@@ -4251,6 +4238,7 @@ def make_benchmark_aerosol_tables(
     gc.collect()
 
 
+@np.errstate(divide="ignore", invalid="ignore")
 def make_benchmark_operations_budget(
         refstr,
         reffiles,
@@ -4746,13 +4734,7 @@ def make_benchmark_operations_budget(
 
         # Load a YAML file containing species properties (such as
         # molecular weights), which we will need for unit conversions.
-        properties = util.read_config_file(
-            os.path.join(
-                spcdb_dir,
-                "species_database.yml"
-            ),
-            quiet=True
-        )
+        properties = util.read_species_database(spcdb_dir)
 
         # Loop over all column sections
         for col_section in col_sections:
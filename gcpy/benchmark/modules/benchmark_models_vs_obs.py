@@ -13,20 +13,34 @@ Linted with PyLint and incorporated into GCPy
 by Bob Yantosca <yantosca@seas.harvard.edu>
 """
 import glob
-from datetime import datetime, timedelta
+import hashlib
+import os
+from datetime import datetime
+from itertools import islice
+from tempfile import TemporaryDirectory
 from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 import xarray as xr
+from joblib import Parallel, delayed
+from pypdf import PdfMerger
 from gcpy.constants import skip_these_vars
 from gcpy.util import verify_variable_type, dataset_reader, make_directory
-from gcpy.cstools import extract_grid
-from gcpy.grid import get_nearest_model_data
+from gcpy.cstools import extract_grid, find_index, is_cubed_sphere
 from gcpy.benchmark.modules.benchmark_utils import \
     get_geoschem_level_metadata, rename_speciesconc_to_speciesconcvv
 
+# Format version of the cached EBAS observations.  Change this
+# whenever the processing in read_observational_data changes,
+# so that caches written by older versions are not used.
+EBAS_CACHE_VERSION = "ebas-npz-1"
+
+# Matplotlib style for the models vs. observations plots
+PLOT_STYLE = "seaborn-v0_8-darkgrid"
+
 
 def read_nas(
         input_file,
@@ -43,7 +57,8 @@ def read_nas(
     verbose         : bool         : Toggles verbose output on/off
 
     Returns
-    obs_dataframe   : pd.DataFrame : Observations at each station site
+    obs_dataframe   : pd.DataFrame : Observations at the station site
+                                     (not yet averaged to hourly values)
     obs_site_coords : dict         : Coords (lon/lat/alt) at each site
     """
     verify_variable_type(input_file, str)
@@ -51,43 +66,45 @@ def read_nas(
     if verbose:
         print(f"read_nas: Reading {input_file}")
 
+    # Read the header lines (the first line contains the number of
+    # header lines).  Then parse the whitespace-delimited data block
+    # from the same file handle with the pandas C parser, which is
+    # much faster than np.loadtxt for large files.
     with open(input_file, encoding='UTF-8') as the_file:
-        header = np.array(
-            [next(the_file) for x in range(155) ]
-        )
-        n_hdr = int(
-            header[0].split(' ')[0]
-        )
-        st_ymd = header[6].split(' ')
-        st_ymd = list(
-            filter(
-                None,
-                st_ymd
-            )
-        )
-        start_date = datetime(
-            int(st_ymd[0]),
-            int(st_ymd[1]),
-            int(st_ymd[2])
-        )
-        for line in header:
-            if 'Station name' in line:
-                site = line.split(':')[1:]
-                site = '_'.join(site).replace('\n','').\
-                    replace('  ',' ').replace('/','-')
-                site = site.replace('Atmospheric Observatory','')
-                site = site.replace(' Research Station','')
-            elif 'Station longitude:' in line:
-                lon = float(line.split(' ')[-1].replace('\n',''))
-            elif 'Station latitude:' in line:
-                lat = float(line.split(' ')[-1].replace('\n',''))
-            elif 'Station altitude:' in line:
-                alt = float(line.split(' ')[-2].replace('\n',''))
-
-    file_hdr = np.loadtxt(
-        input_file,
-        skiprows=n_hdr
+        first_line = next(the_file)
+        n_hdr = int(first_line.split(None, 1)[0])
+        header = [first_line] + list(islice(the_file, n_hdr - 1))
+        file_hdr = pd.read_csv(
+            the_file,
+            header=None,
+            sep=r"\s+",
+            engine="c",
+            dtype=np.float64,
+        ).values
+
+    # Start date of the observations
+    st_ymd = header[6].split()
+    start_date = datetime(
+        int(st_ymd[0]),
+        int(st_ymd[1]),
+        int(st_ymd[2])
     )
+
+    # Get station metadata in a single pass through the header
+    for line in header:
+        if line.startswith('Station name'):
+            site = line.split(':')[1:]
+            site = '_'.join(site).replace('\n','').\
+                replace('  ',' ').replace('/','-')
+            site = site.replace('Atmospheric Observatory','')
+            site = site.replace(' Research Station','')
+        elif line.startswith('Station longitude:'):
+            lon = float(line.split()[-1])
+        elif line.startswith('Station latitude:'):
+            lat = float(line.split()[-1])
+        elif line.startswith('Station altitude:'):
+            alt = float(line.split()[-2])
+
     obs_dataframe = pd.DataFrame(
         file_hdr,
         index=file_hdr[:,0]
@@ -104,8 +121,6 @@ def read_nas(
         index=obs_dataframe.index
     )
     obs_dataframe = obs_dataframe[obs_dataframe.Flag == 0.000]
-    obs_dataframe = obs_dataframe.loc['2019']
-    obs_dataframe = obs_dataframe.resample('H').mean()
     obs_dataframe = pd.DataFrame(
         {
             site: obs_dataframe.Value
@@ -125,7 +140,9 @@ def read_nas(
 
 def read_observational_data(
         path,
-        verbose
+        verbose,
+        use_cache=False,
+        n_job=-1,
 ):
     """
     Reads the observational O3 data from EBAS
@@ -134,9 +151,18 @@ def read_observational_data(
     Loops over all data files (in NASA/Ames format) within
     a folder and concatenates them into a single DataFrame.
 
+    If use_cache=True, the result is cached in a NumPy .npz file
+    (data only, no pickled objects) in the user's cache folder
+    ($XDG_CACHE_HOME/gcpy, or ~/.cache/gcpy), keyed by the cache
+    format version and the names and modification times of the data
+    files, so that subsequent calls can skip parsing the ASCII files.
+
     Args
     path            : str          : Path to the observational data dir
     verbose         : bool         : Toggles verbose output on/off
+    use_cache       : bool         : Read/write the cache file?
+                                     (default: False)
+    n_job           : int          : Number of files to read in parallel
 
     Returns
     obs_dataframe   : pd.DataFrame : Observations at each station site
@@ -144,34 +170,180 @@ def read_observational_data(
     """
     verify_variable_type(path, str)
 
-    first = True
-    obs_site_coords = {}
-    dataframe = None
-    for infile in sorted(glob.glob(f"{path}/*nas")):
-        obs_dataframe, xyz = read_nas(
-            infile,
-            verbose=verbose
+    filepaths = sorted(glob.glob(f"{path}/*nas"))
+
+    # Look for cached data from a previous call.  The cache file name
+    # changes whenever a data file is added, removed, or modified,
+    # or when the cache format version changes.
+    cache_file = None
+    if use_cache and filepaths:
+        file_hash = hashlib.sha1(f"{EBAS_CACHE_VERSION};".encode())
+        for infile in filepaths:
+            infile = os.path.abspath(infile)
+            file_hash.update(f"{infile}:{os.path.getmtime(infile)};".encode())
+        cache_file = os.path.join(
+            os.environ.get("XDG_CACHE_HOME") or
+            os.path.join(os.path.expanduser("~"), ".cache"),
+            "gcpy",
+            f"ebas_{file_hash.hexdigest()[:16]}.npz"
         )
-        if first:
-            dataframe = obs_dataframe
-            obs_site_coords.update(xyz)
-            first = False
-        else:
-            dataframe = pd.concat(
-                [dataframe, obs_dataframe],
-                axis=1
-            )
-            obs_site_coords.update(xyz)
-
-    # If dataframe0 is undefined, the loop didn't execute... so throw error
-    if dataframe is None:
+        if os.path.isfile(cache_file):
+            if verbose:
+                print(f"read_observational_data: Reading {cache_file}")
+            return read_observational_data_cache(cache_file)
+
+    # Read each data file.  The files are independent of each other,
+    # so read them in parallel.  Turn off parallelization if n_job=1.
+    if n_job != 1:
+        results = Parallel(n_jobs=n_job, batch_size=8)(
+            delayed(read_nas)(infile, verbose=verbose)
+            for infile in filepaths
+        )
+    else:
+        results = [
+            read_nas(infile, verbose=verbose)
+            for infile in filepaths
+        ]
+
+    # If no files were read, then throw an error
+    if not results:
         raise ValueError(f"Could not find data in {path}!")
 
-    obs_dataframe = dataframe.groupby(
-        dataframe.columns,
-        axis=1
+    # Combine the data from all files into one long Series (indexed
+    # by file number and time), with a single concatenation
+    dataframes, site_coords = zip(*results)
+    site_names = [frame.columns[0] for frame in dataframes]
+    dataframe = pd.concat(
+        [frame.iloc[:, 0] for frame in dataframes],
+        keys=range(len(dataframes)),
+        names=["file", "time"],
+        copy=False,
+    )
+    obs_site_coords = {
+        site: coords
+        for xyz in site_coords
+        for site, coords in xyz.items()
+    }
+
+    # Keep only observations for 2019, then compute hourly means
+    # for all files at once (instead of resampling each file)
+    times = dataframe.index.get_level_values("time")
+    dataframe = dataframe[times.year == 2019]
+    dataframe = dataframe.groupby(
+        [
+            pd.Grouper(level="file"),
+            pd.Grouper(level="time", freq="H")
+        ]
+    ).mean()
+
+    # Some sites have data in more than one file, so take the maximum
+    # over files at each site.  Doing this on the long Series avoids a
+    # (slow) groupby along the columns of the wide DataFrame.
+    files = dataframe.index.get_level_values("file")
+    dataframe = dataframe.groupby(
+        [
+            pd.Index(np.asarray(site_names)[files], name="site"),
+            dataframe.index.get_level_values("time")
+        ]
     ).max()
 
+    # Create a DataFrame with a column per site.  Sites without
+    # any 2019 data will be represented by missing values.
+    obs_dataframe = dataframe.unstack("site").reindex(
+        columns=sorted(set(site_names))
+    )
+    obs_dataframe.columns.name = None
+
+    # Save to the cache file (skip if the cache folder is read-only)
+    if cache_file is not None:
+        try:
+            write_observational_data_cache(
+                cache_file,
+                obs_dataframe,
+                obs_site_coords
+            )
+        except OSError as err:
+            if verbose:
+                print(f"read_observational_data: Could not cache data: {err}")
+
+    return obs_dataframe, obs_site_coords
+
+
+def write_observational_data_cache(
+        cache_file,
+        obs_dataframe,
+        obs_site_coords,
+):
+    """
+    Writes the observational data returned by read_observational_data
+    to a NumPy .npz file.  Only plain arrays (times, site names, and
+    values) are stored, so the file can be read without unpickling.
+
+    Args
+    cache_file      : str          : Path to the cache file
+    obs_dataframe   : pd.DataFrame : Observations at each station site
+    obs_site_coords : dict         : Coords (lon/lat/alt) at each site
+    """
+    coord_sites = list(obs_site_coords)
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+
+    # Write to a temporary file first, so that other processes
+    # never see a partially written cache file
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, "wb") as ofile:
+            np.savez(
+                ofile,
+                times=obs_dataframe.index.values.astype("datetime64[ns]"),
+                sites=np.asarray(obs_dataframe.columns, dtype=str),
+                values=obs_dataframe.to_numpy(dtype=np.float64),
+                coord_sites=np.asarray(coord_sites, dtype=str),
+                coord_values=np.array(
+                    [
+                        [obs_site_coords[site][key]
+                         for key in ("lon", "lat", "alt")]
+                        for site in coord_sites
+                    ],
+                    dtype=np.float64
+                ).reshape(-1, 3),
+            )
+        os.replace(tmp_file, cache_file)
+    finally:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+
+def read_observational_data_cache(
+        cache_file,
+):
+    """
+    Reads observational data written by write_observational_data_cache.
+
+    Args
+    cache_file      : str          : Path to the cache file
+
+    Returns
+    obs_dataframe   : pd.DataFrame : Observations at each station site
+    obs_site_coords : dict         : Coords (lon/lat/alt) at each site
+    """
+    with np.load(cache_file, allow_pickle=False) as data:
+        obs_dataframe = pd.DataFrame(
+            data["values"],
+            index=pd.DatetimeIndex(data["times"], name="time"),
+            columns=data["sites"].tolist(),
+        )
+        obs_site_coords = {
+            site: {
+                "lon": lon,
+                "lat": lat,
+                "alt": alt,
+            }
+            for site, (lon, lat, alt) in zip(
+                data["coord_sites"].tolist(),
+                data["coord_values"].tolist()
+            )
+        }
+
     return obs_dataframe, obs_site_coords
 
 
@@ -200,17 +372,35 @@ def read_model_data(
         multi_files=True,
         verbose=verbose,
     )
-    
+
     # Read data and rename SpeciesConc_ to SpeciesConcVV_, if necessary
     # (needed for backwards compatibility with older versions.)
-    dataset = reader(filepaths,drop_variables=skip_these_vars).load()
+    # NOTE: Do not load the data into memory here.  The data will be
+    # read from disk (one dask chunk per time slice) only at the grid
+    # boxes nearest to the observation sites.  Open the files in
+    # parallel, and skip the (slow) equality checks of variables that
+    # do not depend on time.
+    dataset = reader(
+        filepaths,
+        drop_variables=skip_these_vars,
+        chunks={"time": 1},
+        parallel=True,
+        combine="by_coords",
+        data_vars="minimal",
+        coords="minimal",
+        compat="override",
+    )
     dataset = rename_speciesconc_to_speciesconcvv(dataset)
 
-    # Create a DataArray object and convert to ppbv (if necessary)
+    # Create a DataArray object and convert to ppbv (if necessary).
+    # Single precision is sufficient for plotting, so make sure that
+    # the data (and the DataFrames created from it) are float32.
     with xr.set_options(keep_attrs=True):
-        dataarray = dataset[varname]
+        dataarray = dataset[varname].astype(np.float32, copy=False)
         if "mol mol-1" in dataarray.attrs["units"]:
-            dataarray.values *= 1.0e9
+            # Use a scalar of the same type as the data, so that
+            # float32 data is not promoted to float64
+            dataarray = dataarray * dataarray.dtype.type(1.0e9)
             dataarray.attrs["units"] = "ppbv"
 
     return dataarray
@@ -234,151 +424,166 @@ def find_times(
     start_time    : str          : Reference start time for obs data
     """
     end_time = obs_dataframe[obs_dataframe.columns[1]]
-    time_x = []
-
-    for index in range(len(end_time)):
-        time_x.append(start_time + timedelta(days=end_time.values[index]))
 
-    obs_dataframe.index = time_x
+    # Convert all of the end times (in days since the start time)
+    # to a DatetimeIndex at once, instead of looping over rows
+    obs_dataframe.index = pd.Timestamp(start_time) + \
+        pd.to_timedelta(end_time.values, unit="D")
     qcflag =obs_dataframe[obs_dataframe.columns[-1]]
     obs_dataframe = obs_dataframe[obs_dataframe.columns[2]]
 
     return obs_dataframe, qcflag
 
 
-def get_nearest_model_data_to_obs(
+def get_nearest_model_indices(
         gc_data,
         gc_levels,
-        lon_value,
-        lat_value,
-        alt_value,
+        obs_site_coords,
         gc_cs_grid=None
-
 ):
     """
-    Returns GEOS-Chem model data (on a cubed-sphere grid) at the
-    grid box closest to an observation site location.
+    Returns the indices of the GEOS-Chem grid boxes closest to each
+    observation site location.  The indices for all sites are
+    computed at once.
 
     Args
-    gc_data    : pd.DataFrame : Observations at each station site
-    gc_levels  : pd.DataFrame : Metadata for model vertical levels
-    lon_value  : float        : Longitude of station site
-    lat_value  : float        : Latitude of station site
-    alt_value  : float        : Altitude of station site
-    gc_cs_grid : xr.Dataset   : Metadata for Dev cubed-sphere grid
+    gc_data         : xr.DataArray : GEOS-Chem model data
+    gc_levels       : pd.DataFrame : Metadata for model vertical levels
+    obs_site_coords : dict         : Coords (lon/lat/alt) at each site
+    gc_cs_grid      : xr.Dataset   : Metadata for cubed-sphere grid
 
     Returns
-    dataframe  : pd.DataFrame : Model data closest to the station site
+    indexers        : dict         : Index arrays (one element per site)
+                                     for each dimension of gc_data
     """
     verify_variable_type(gc_data, xr.DataArray)
     verify_variable_type(gc_cs_grid, (xr.Dataset, type(None)))
     verify_variable_type(gc_levels, pd.DataFrame)
+    verify_variable_type(obs_site_coords, dict)
+
+    # Coordinates of each observation site
+    site_names = list(obs_site_coords.keys())
+    lon_values = np.array(
+        [round(obs_site_coords[site]['lon'], 2) for site in site_names]
+    )
+    lat_values = np.array(
+        [round(obs_site_coords[site]['lat'], 2) for site in site_names]
+    )
+    alt_values = np.array(
+        [round(obs_site_coords[site]['alt'], 1) for site in site_names]
+    )
 
     # Prevent the latitude from getting too close to the N or S poles
-    lat_value = max(min(lat_value, 89.75), -89.75)
+    lat_values = np.clip(lat_values, -89.75, 89.75)
+
+    # Nearest GEOS-Chem level to each observation.  Level altitudes
+    # increase monotonically, so the nearest level can be found with
+    # a binary search of the altitudes halfway between adjacent levels.
+    gc_alts = gc_levels["Altitude (m)"].values
+    indexers = {
+        "lev": np.searchsorted(0.5 * (gc_alts[1:] + gc_alts[:-1]), alt_values)
+    }
 
-    # Nearest GEOS-Chem data to (lat, lon) of observation
-    dframe = get_nearest_model_data(
+    # Nearest GEOS-Chem grid box to (lat, lon) of each observation
+    if is_cubed_sphere(gc_data):
+        cs_indices = find_index(lat_values, lon_values, gc_cs_grid)
+        indexers["nf"] = cs_indices[0, :]
+        indexers["Ydim"] = cs_indices[1, :]
+        indexers["Xdim"] = cs_indices[2, :]
+    else:
+        indexers["lon"] = np.abs(
+            gc_data.lon.values[np.newaxis, :] - lon_values[:, np.newaxis]
+        ).argmin(axis=1)
+        indexers["lat"] = np.abs(
+            gc_data.lat.values[np.newaxis, :] - lat_values[:, np.newaxis]
+        ).argmin(axis=1)
+
+    return indexers
+
+
+def get_nearest_model_data_to_obs(
         gc_data,
-        lon_value,
-        lat_value,
-        gc_cs_grid=gc_cs_grid
-    )
-    dframe = dframe.reset_index()
+        gc_levels,
+        obs_site_coords,
+        gc_cs_grid=None,
+        indexers=None,
+):
+    """
+    Returns GEOS-Chem model data at the grid boxes closest to each
+    observation site location.  The grid box indices for all sites
+    are computed at once, so that the model data can be extracted
+    with a single (vectorized) indexing operation.
 
-    # Nearest GEOS-Chem level to observation
-    gc_alts = gc_levels["Altitude (m)"].values
-    n_alts = len(gc_alts)
-    z_idx =(np.abs(gc_alts - float(alt_value))).argmin()
+    Args
+    gc_data         : xr.DataArray : GEOS-Chem model data
+    gc_levels       : pd.DataFrame : Metadata for model vertical levels
+    obs_site_coords : dict         : Coords (lon/lat/alt) at each site
+    gc_cs_grid      : xr.Dataset   : Metadata for cubed-sphere grid
+    indexers        : dict|None    : Precomputed grid box indices (from
+                                     get_nearest_model_indices)
+
+    Returns
+    dataframe       : pd.DataFrame : Model data closest to each site
+                                     (one column per site)
+    """
+    verify_variable_type(gc_data, xr.DataArray)
+    verify_variable_type(obs_site_coords, dict)
+    verify_variable_type(indexers, (dict, type(None)))
+
+    # Indices of the grid boxes nearest to each observation site
+    if indexers is None:
+        indexers = get_nearest_model_indices(
+            gc_data,
+            gc_levels,
+            obs_site_coords,
+            gc_cs_grid=gc_cs_grid
+        )
 
-    # Pick out elements of the dataframe at the nearest level to obs
-    rows = np.zeros(len(dframe), dtype=bool)
-    good = [(v * n_alts) + z_idx for v in range(12)]
-    rows[good] = True
+    # Extract the data at all sites at once (dimensions: time, site)
+    dataarray = gc_data.isel(
+        {dim: xr.DataArray(idx, dims="site") for dim, idx in indexers.items()}
+    ).transpose("time", "site")
 
-    return dframe[rows].set_index("time")
+    return pd.DataFrame(
+        dataarray.values,
+        index=pd.Index(dataarray["time"].values, name="time"),
+        columns=list(obs_site_coords.keys())
+    )
 
 
 def prepare_data_for_plot(
-        obs_dataframe,
         obs_site_coords,
         obs_site_name,
-        ref_dataarray,
-        ref_cs_grid,
-        dev_dataarray,
-        dev_cs_grid,
-        gc_levels,
+        ref_dataframe,
+        dev_dataframe,
         varname="SpeciesConcVV_O3",
 ):
     """
     Prepares data for passing to routine plot_single_frames as follows:
 
-    (1) Computes the mean of observations at the given station site.
-    (2) Returns the GEOS-Chem Ref and Dev data at the gridbox closest
-         to the given station site.
-    (3) Creates the top-of-plot title for the given station site.
+    (1) Returns the GEOS-Chem Ref and Dev data at the gridbox closest
+         to the given station site (from the data at all sites).
+    (2) Creates the top-of-plot title for the given station site.
 
     Args:
-    obs_dataframe   : pd.DataFrame : Observations at each station site
     obs_site_coords : dict         : Coords (lon/lat/alt) at each site
     obs_site_name   : str          : Names of station sites
-    ref_dataarray   : xr.DataArray : Data from the Ref model version
-    ref_label       : str          : Label for the Ref model data
-    ref_cs_grid     : xr.Dataset   : Metadata for Ref cubed-sphere grid
-    dev_dataarray   : xr.DataArray : Data from the Dev model version
-    dev_label       : str          : Label for the Dev model data
-    dev_cs_grid     : xr.Dataset   : Metadata for Dev cubed-sphere grid
-    gc_levels       : pd.DataFrame : Metadata for model vertical levels
+    ref_dataframe   : pd.DataFrame : Ref data nearest to each site
+    dev_dataframe   : pd.DataFrame : Dev data nearest to each site
     varname         : str          : Variable name for model data
 
     Returns:
-    obs_dataframe   : pd.DataFrame : Mean observational data @ station site
     ref_series      : pd.Series    : Ref data nearest to the station site
     dev_series      : pd.Series    : Dev data nearest to the station site
     subplot_title   : str          : Title for the station site subplot
     subplot_ylabel  : str          : Y-axis titel for the station site subplot
     """
-    verify_variable_type(obs_dataframe, pd.DataFrame)
     verify_variable_type(obs_site_coords, dict)
     verify_variable_type(obs_site_name, str)
-    verify_variable_type(ref_dataarray, xr.DataArray)
-    verify_variable_type(dev_dataarray, xr.DataArray)
-    verify_variable_type(ref_cs_grid, (xr.Dataset, type(None)))
-    verify_variable_type(dev_cs_grid, (xr.Dataset, type(None)))
-    verify_variable_type(gc_levels, pd.DataFrame)
+    verify_variable_type(ref_dataframe, pd.DataFrame)
+    verify_variable_type(dev_dataframe, pd.DataFrame)
     verify_variable_type(varname, str)
 
-    # Get data from the Ref model closest to the data site
-    coords = [
-        round(obs_site_coords[obs_site_name]['lon'], 2),
-        round(obs_site_coords[obs_site_name]['lat'], 2),
-        round(obs_site_coords[obs_site_name]['alt'], 1)
-    ]
-
-    # Get data from the Ref model closest to the obs site
-    ref_dataframe = get_nearest_model_data_to_obs(
-        ref_dataarray,
-        gc_levels,
-        coords[0],                 # Obs site lon
-        coords[1],                 # Obs site lat
-        coords[2],                 # Obs site alt
-        gc_cs_grid=ref_cs_grid
-    )
-
-    # Get data from the Dev model closest to the obs site
-    dev_dataframe = get_nearest_model_data_to_obs(
-        dev_dataarray,
-        gc_levels,
-        coords[0],                 # Obs site lon
-        coords[1],                 # Obs site lat
-        coords[2],                 # Obs site alt
-        gc_cs_grid=dev_cs_grid,
-    )
-
-    # Take the monthly mean of observations for plotting
-    # (since some observation sites have multiple months of data)
-    obs_dataframe = obs_dataframe.resample('M').mean()
-
     # Create the top title for the subplot for this observation site
     # (use integer lon & lat values and N/S lat and E/W lon notation)
     lon = int(round(obs_site_coords[obs_site_name]['lon'], 0))
@@ -397,13 +602,12 @@ def prepare_data_for_plot(
     # Y-axis label (i.e. species name)
     subplot_ylabel = varname.split("_")[1] + " (ppbv)"
 
-    return obs_dataframe, ref_dataframe[varname], dev_dataframe[varname], \
+    return ref_dataframe[obs_site_name], dev_dataframe[obs_site_name], \
         subplot_title, subplot_ylabel
 
 
 def plot_single_station(
-        fig,
-        rows_per_page,
+        axes_subplot,
         cols_per_page,
         subplot_index,
         subplot_title,
@@ -420,8 +624,7 @@ def plot_single_station(
     Plots observation data vs. model data at a single station site.
 
     Args:
-    obs_dataframe  : mpl.figure.Figure : Figure object for the plot
-    rows_per_page  : int               : # of rows to plot on a page
+    axes_subplot   : mpl.axes.Axes     : Axes object for this subplot
     cols_per_page  : int               : # of columns to plot on a page
     subplot_index  : int               : Index of each subplot
     subplot_title  : str               : Title for each subplot
@@ -433,8 +636,7 @@ def plot_single_station(
     dev_dataarray  : pd.Series         : Data from the Dev model version
     dev_label      : str               : Label for the Dev model data
     """
-    verify_variable_type(fig, Figure)
-    verify_variable_type(rows_per_page, int)
+    verify_variable_type(axes_subplot, Axes)
     verify_variable_type(cols_per_page, int)
     verify_variable_type(subplot_index, int)
     verify_variable_type(subplot_title, str)
@@ -445,14 +647,6 @@ def plot_single_station(
     verify_variable_type(dev_series, pd.Series)
     verify_variable_type(dev_label, str)
 
-    # Create matplotlib axes object for this subplot
-    # axes_subplot is of type matplotlib.axes_.subplots.AxesSubplot
-    axes_subplot = fig.add_subplot(
-        rows_per_page,
-        cols_per_page,
-        subplot_index + 1,
-    )
-
     # Set title for top of each frame
     axes_subplot.set_title(
         f"{subplot_title}",
@@ -498,135 +692,150 @@ def plot_single_station(
             fontsize=8
         )
 
-    # Set X-axis and Y-axis ticks and labels
-    axes_subplot.set_xticks(
-        obs_dataframe.index
-    )
-    # NOTE: In newer versions of matplotlib you can pass the
-    # xticklabels keyword to the set_xticks function.  But we need
-    # to set the xticklabels separately for backwards compatibility
-    # with older matplotlib versions. -- Bob Yantosca (06 Jul 2023)
-    axes_subplot.set_xticklabels(
-        ['J','F','M','A','M','J','J','A','S','O','N','D']
-    )
-    axes_subplot.set_ylim(
-        0,
-        80
-    )
-    axes_subplot.set_yticks(
-        [0, 20, 40, 60, 80]
-    )
-    axes_subplot.tick_params(
-        axis='both',
-        which='major',
-        labelsize=6
-    )
-
 
 def plot_one_page(
-        pdf,
+        pdf_file,
         obs_dataframe,
         obs_label,
         obs_site_coords,
         obs_site_names,
-        ref_dataarray,
+        ref_dataframe,
         ref_label,
-        ref_cs_grid,
-        dev_dataarray,
+        dev_dataframe,
         dev_label,
-        dev_cs_grid,
-        gc_levels,
         rows_per_page=3,
         cols_per_page=3,
         varname="SpeciesConcVV_O3",
 ):
     """
-    Plots a single page of models vs. observations.
+    Plots a single page of models vs. observations, and saves it
+    to a (single-page) PDF file.
 
     Args:
-    obs_dataframe   : pd.DataFrame : Observations at each station site.
+    pdf_file        : str          : Path of the PDF file to create
+    obs_dataframe   : pd.DataFrame : Monthly mean obs at each station site
     obs_label       : str          : Label for the observational data
     obs_site_coords : dict         : Coords (lon/lat/alt) at each site.
     obs_site_names  : list         : Names of station sites per page
-    ref_dataarray   : xr.DataArray : Data from the Ref model version
+    ref_dataframe   : pd.DataFrame : Ref data nearest to each site
     ref_label       : str          : Label for the Ref model data
-    ref_cs_grid     : str|None     : Metadata for Ref cubed-sphere grid
-    dev_dataarray   : xr.DataArray : Data from the Dev model version
+    dev_dataframe   : pd.DataFrame : Dev data nearest to each site
     dev_label       : str          : Label for the Dev model data
-    dev_cs_grid     : str|None     : Metadata for Dev cubed-sphere grid
-    gc_levels       : pd.DataFrame : Metadata for model vertical levels
     rows_per_page   : int          : Number of rows to plot on a page
     varname         : str          : Variable name for model data
     """
+    verify_variable_type(pdf_file, str)
     verify_variable_type(obs_dataframe, pd.DataFrame)
     verify_variable_type(obs_site_coords, dict)
     verify_variable_type(obs_site_names, list)
-    verify_variable_type(ref_dataarray, xr.DataArray)
+    verify_variable_type(ref_dataframe, pd.DataFrame)
     verify_variable_type(ref_label, str)
-    verify_variable_type(ref_cs_grid, (xr.Dataset, type(None)))
-    verify_variable_type(dev_dataarray, xr.DataArray)
+    verify_variable_type(dev_dataframe, pd.DataFrame)
     verify_variable_type(dev_label, str)
-    verify_variable_type(dev_cs_grid, (xr.Dataset, type(None)))
-    verify_variable_type(gc_levels, pd.DataFrame)
 
     # Define a new matplotlib.figure.Figure object for this page
     # Landscape width: 11" x 8"
-    fig = plt.figure(figsize=(11, 8))
-    fig.tight_layout()
-
-    # Loop over all of the stations that fit on the page
-    for subplot_index, obs_site_name in enumerate(obs_site_names):
-
-        # Find the model Ref & Dev data closest to the observational
-        # station site.  Also take monthly average of observations,
-        obs_dataframe, \
-        ref_series, dev_series, \
-        subplot_title, subplot_ylabel \
-        = prepare_data_for_plot(
-            obs_dataframe,                # pandas.DataFrame
-            obs_site_coords,              # dict
-            obs_site_name,                # str
-            ref_dataarray,                # xarray.DataArray
-            ref_cs_grid,                  # dict or none
-            dev_dataarray,                # xarray.DataArray
-            dev_cs_grid,                  # dict or none
-            gc_levels,                    # pandas.DataFrame
-            varname=varname               # str
+    # NOTE: Create the Figure directly instead of with pyplot, so that
+    # pages can be rendered in parallel processes without relying on
+    # an interactive backend.  The plot style must be applied here,
+    # as it is not inherited by the parallel processes.
+    with plt.style.context(PLOT_STYLE):
+        fig = Figure(figsize=(11, 8))
+        fig.tight_layout()
+
+        # Create all subplots at once.  The X and Y axes are shared,
+        # so the ticks and labels only need to be set once per page.
+        axes = fig.subplots(
+            rows_per_page,
+            cols_per_page,
+            sharex=True,
+            sharey=True,
+            squeeze=False
+        ).flatten()
+
+        # Set X-axis and Y-axis ticks and labels
+        axes[0].set_xticks(
+            obs_dataframe.index
         )
-
-        # Plot models vs. observation for a single station site
-        plot_single_station(
-            fig,                          # matplotlib.figure.Figure
-            rows_per_page,                # int
-            cols_per_page,                # int
-            subplot_index,                # int
-            subplot_title,                # str
-            subplot_ylabel,               # str
-            obs_dataframe,                # pandas.Dataframe
-            obs_label,                    # str
-            obs_site_name,                # str
-            ref_series,                   # pandas.Series
-            ref_label,                    # str
-            dev_series,                   # pandas.Series
-            dev_label,                    # str
+        # NOTE: In newer versions of matplotlib you can pass the
+        # xticklabels keyword to the set_xticks function.  But we need
+        # to set the xticklabels separately for backwards compatibility
+        # with older matplotlib versions. -- Bob Yantosca (06 Jul 2023)
+        axes[0].set_xticklabels(
+            ['J','F','M','A','M','J','J','A','S','O','N','D']
+        )
+        axes[0].set_ylim(
+            0,
+            80
         )
+        axes[0].set_yticks(
+            [0, 20, 40, 60, 80]
+        )
+        for axes_subplot in axes:
+            axes_subplot.tick_params(
+                axis='both',
+                which='major',
+                labelsize=6
+            )
 
-    # Add extra spacing around plots
-    plt.subplots_adjust(
-        hspace=0.4,
-        top=0.9
-    )
+        # Remove unused subplots (on the last page).  Show X-axis
+        # labels on subplots that no longer have a subplot below.
+        n_sites = len(obs_site_names)
+        for subplot_index in range(n_sites, len(axes)):
+            axes[subplot_index].remove()
+            if subplot_index - cols_per_page >= 0:
+                axes[subplot_index - cols_per_page].xaxis.set_tick_params(
+                    labelbottom=True
+                )
+
+        # Loop over all of the stations that fit on the page
+        for subplot_index, obs_site_name in enumerate(obs_site_names):
+
+            # Find the model Ref & Dev data closest to the observational
+            # station site.
+            ref_series, dev_series, \
+            subplot_title, subplot_ylabel \
+            = prepare_data_for_plot(
+                obs_site_coords,              # dict
+                obs_site_name,                # str
+                ref_dataframe,                # pandas.DataFrame
+                dev_dataframe,                # pandas.DataFrame
+                varname=varname               # str
+            )
 
-    # Add top-of-page legend
-    plt.legend(
-        ncol=3,
-        bbox_to_anchor=(0.5, 0.98),
-        bbox_transform=fig.transFigure,
-        loc='upper center'
-    )
+            # Plot models vs. observation for a single station site
+            plot_single_station(
+                axes[subplot_index],          # matplotlib.axes.Axes
+                cols_per_page,                # int
+                subplot_index,                # int
+                subplot_title,                # str
+                subplot_ylabel,               # str
+                obs_dataframe,                # pandas.Dataframe
+                obs_label,                    # str
+                obs_site_name,                # str
+                ref_series,                   # pandas.Series
+                ref_label,                    # str
+                dev_series,                   # pandas.Series
+                dev_label,                    # str
+            )
+
+        # Add extra spacing around plots
+        fig.subplots_adjust(
+            hspace=0.4,
+            top=0.9
+        )
 
-    # Save this page to the PDF file
-    pdf.savefig(fig)
+        # Add top-of-page legend
+        fig.axes[-1].legend(
+            ncol=3,
+            bbox_to_anchor=(0.5, 0.98),
+            bbox_transform=fig.transFigure,
+            loc='upper center'
+        )
+
+        # Save this page to the PDF file
+        with PdfPages(pdf_file) as pdf:
+            pdf.savefig(fig)
 
 
 def plot_models_vs_obs(
@@ -640,6 +849,7 @@ def plot_models_vs_obs(
         gc_levels,
         varname="SpeciesConcVV_O3",
         dst="./benchmark",
+        n_job=-1,
 ):
     """
     Plots models vs. observations using a 3 rows x 3 column layout.
@@ -655,6 +865,7 @@ def plot_models_vs_obs(
     gc_levels       : pd.DataFrame : Metadata for model vertical levels
     varname         : str          : Variable name for model data
     dst             : str          : Destination folder for plots
+    n_job           : int          : Number of pages to plot in parallel
     """
     verify_variable_type(obs_dataframe, pd.DataFrame)
     verify_variable_type(obs_site_coords, dict)
@@ -669,57 +880,114 @@ def plot_models_vs_obs(
     ref_cs_grid = extract_grid(ref_dataarray)
     dev_cs_grid = extract_grid(dev_dataarray)
 
+    # Indices of the grid boxes nearest to all station sites.
+    # If Ref & Dev are on the same grid, only compute these once.
+    ref_indexers = get_nearest_model_indices(
+        ref_dataarray,
+        gc_levels,
+        obs_site_coords,
+        gc_cs_grid=ref_cs_grid
+    )
+    if ref_cs_grid is not None and dev_cs_grid is not None:
+        same_grid = ref_cs_grid.equals(dev_cs_grid)
+    elif ref_cs_grid is None and dev_cs_grid is None:
+        same_grid = ref_dataarray["lon"].equals(dev_dataarray["lon"]) and \
+            ref_dataarray["lat"].equals(dev_dataarray["lat"])
+    else:
+        same_grid = False
+    dev_indexers = ref_indexers
+    if not same_grid:
+        dev_indexers = get_nearest_model_indices(
+            dev_dataarray,
+            gc_levels,
+            obs_site_coords,
+            gc_cs_grid=dev_cs_grid
+        )
+
+    # Get the Ref & Dev data nearest to all station sites at once,
+    # instead of looking up each site separately
+    ref_dataframe = get_nearest_model_data_to_obs(
+        ref_dataarray,
+        gc_levels,
+        obs_site_coords,
+        indexers=ref_indexers
+    )
+    dev_dataframe = get_nearest_model_data_to_obs(
+        dev_dataarray,
+        gc_levels,
+        obs_site_coords,
+        indexers=dev_indexers
+    )
+
     # Figure setup
-    plt.style.use("seaborn-v0_8-darkgrid")
     rows_per_page = 3
     cols_per_page = 3
     plots_per_page = rows_per_page * cols_per_page
 
-    # Open the plot as a PDF document
+    # Take the monthly mean of observations for plotting
+    # (since some observation sites have multiple months of data).
+    # Do this once here for all sites, instead of once per site.
+    obs_monthly = obs_dataframe.resample('M').mean()
+
+    # Name of the PDF file to create
     pdf_file = f"{dst}/models_vs_obs.surface.{varname.split('_')[1]}.pdf"
-    pdf = PdfPages(pdf_file)
 
-    # Sort station sites N to S latitude order according to:
-    # https://www.geeksforgeeks.org/python-sort-nested-dictionary-by-key/
-    # NOTE: obs_site_names will be a MultiIndex list (a list of tuples)
+    # Sort station sites in N to S latitude order
     obs_site_names = sorted(
-        obs_site_coords.items(),
-        key = lambda x: x[1]['lat'],
+        obs_site_coords,
+        key=lambda site: obs_site_coords[site]['lat'],
         reverse=True
     )
 
-    # Convert obs_site_names from a MultiIndex list to a regular list
-    obs_site_names = [list(tpl)[0] for tpl in obs_site_names]
-
-    # Loop over the number of obs sites that fit on a page
-    for start in range(0, len(obs_site_names), plots_per_page):
-        end = start + plots_per_page - 1
-
-        # Plot obs sites that fit on a single page
-        plot_one_page(
-            pdf,                          # PdfPages
-            obs_dataframe,                # pandas.DataFrame
-            obs_label,                    # str
-            obs_site_coords,              # dict
-            obs_site_names[start:end+1],  # list of str
-            ref_dataarray,                # xarray.DataArray
-            ref_label,                    # str
-            ref_cs_grid,                  # xarray.DataSet or NoneType
-            dev_dataarray,                # xarray.DataArray
-            dev_label,                    # str
-            dev_cs_grid,                  # xarray.Dataset or NoneType
-            gc_levels,                    # pandas.DataFrame
-            rows_per_page=rows_per_page,  # int
-            cols_per_page=cols_per_page,  # int
-            varname=varname,              # str
-        )
+    # Split the sorted station sites into pages
+    pages = [
+        obs_site_names[start:start+plots_per_page]
+        for start in range(0, len(obs_site_names), plots_per_page)
+    ]
 
-    # Close the PDF file after all pages are plotted.
-    pdf.close()
+    # Plot each page (i.e. the obs sites that fit on a single page)
+    # to a separate PDF file in a temporary folder.  Pages are
+    # independent of each other, so they can be plotted in parallel.
+    # Turn off parallelization if n_job=1.
+    with TemporaryDirectory() as temp_dir:
+        page_files = [
+            os.path.join(temp_dir, f"page{page:04d}.pdf")
+            for page in range(len(pages))
+        ]
+        page_args = [
+            (
+                page_file,                    # str
+                obs_monthly,                  # pandas.DataFrame
+                obs_label,                    # str
+                obs_site_coords,              # dict
+                page_site_names,              # list of str
+                ref_dataframe,                # pandas.DataFrame
+                ref_label,                    # str
+                dev_dataframe,                # pandas.DataFrame
+                dev_label,                    # str
+            )
+            for page_file, page_site_names in zip(page_files, pages)
+        ]
+        page_kwargs = {
+            "rows_per_page": rows_per_page,   # int
+            "cols_per_page": cols_per_page,   # int
+            "varname": varname,               # str
+        }
+        if n_job != 1:
+            Parallel(n_jobs=n_job)(
+                delayed(plot_one_page)(*args, **page_kwargs)
+                for args in page_args
+            )
+        else:
+            for args in page_args:
+                plot_one_page(*args, **page_kwargs)
 
-    # Reset the plot style (this prevents the seaborn style from
-    # being applied to other model vs. obs plotting scripts)
-    plt.style.use("default")
+        # Merge the pages into a single PDF file
+        merge = PdfMerger()
+        for page_file in page_files:
+            merge.append(page_file)
+        merge.write(pdf_file)
+        merge.close()
 
 
 def make_benchmark_models_vs_obs_plots(
@@ -732,7 +1000,9 @@ def make_benchmark_models_vs_obs_plots(
         varname="SpeciesConcVV_O3",
         dst="./benchmark",
         verbose=False,
-        overwrite=False
+        overwrite=False,
+        n_job=-1,
+        use_cache=False,
 ):
     """
     Driver routine to create model vs. observation plots.
@@ -748,6 +1018,8 @@ def make_benchmark_models_vs_obs_plots(
     dst           : str      : Destination folder for plots
     verbose       : bool     : Toggles verbose output on/off
     overwrite     : bool     : Toggles overwriting contents of dst
+    n_job         : int      : Number of parallel jobs (-1 = all cores)
+    use_cache     : bool     : Read/write the cache of observational data
     """
     verify_variable_type(obs_filepaths, (str, list))
     verify_variable_type(ref_filepaths, (str, list))
@@ -770,7 +1042,9 @@ def make_benchmark_models_vs_obs_plots(
     # Read the observational data
     obs_dataframe, obs_site_coords = read_observational_data(
         obs_filepaths,
-        verbose=verbose
+        verbose=verbose,
+        use_cache=use_cache,
+        n_job=n_job,
     )
 
     # Read the model data
@@ -795,4 +1069,5 @@ def make_benchmark_models_vs_obs_plots(
         gc_levels,                        # pandas.DataFrame
         varname=varname,                  # str
         dst=dst,                          # str
+        n_job=n_job,                      # int
     )
@@ -3,15 +3,14 @@ Utility functions specific to the benchmark plotting/tabling scripts.
 TODO: Migrate other benchmark-specific utilities from gcpy/benchmark.py to here.
 """
 import os
+import re
+from functools import lru_cache
 import numpy as np
 import xarray as xr
 import pandas as pd
 from gcpy import util
 from gcpy.constants import skip_these_vars
 
-# Suppress numpy divide by zero warnings to prevent output spam
-np.seterr(divide="ignore", invalid="ignore")
-
 # YAML files
 AOD_SPC = "aod_species.yml"
 BENCHMARK_CAT = "benchmark_categories.yml"
@@ -66,6 +65,7 @@ def read_ref_and_dev(
         dev,
         time_mean=False,
         multi_file=False,
+        prefix=None,
         verbose=False
 ):
     """
@@ -80,56 +80,145 @@ def read_ref_and_dev(
     -----------------------
     multi_file (bool) : Read multiple files w/o taking avg over time
     time_mean  (bool) : Return the average over the time dimension?
+    prefix     (str ) : Only keep variables whose names start with prefix
     verbose    (bool) : Enable verbose output
 
     Returns:
     ref_data : xr.Dataset : Data from the Ref model
     dev_data : xr.Dataset : Data from the Dev model
+                            (shallow copy of ref_data if ref and dev
+                            are the same file(s))
     """
     util.verify_variable_type(ref, (str, list))
     util.verify_variable_type(dev, (str, list))
     util.verify_variable_type(time_mean, bool)
+    util.verify_variable_type(prefix, (str, type(None)))
 
     ref_data = None
     dev_data = None
     reader = util.dataset_reader(time_mean|multi_file, verbose=verbose)
 
+    # When reading multiple files, open them in parallel and read the
+    # data lazily (one time slice per chunk).  Nothing is read from
+    # disk until after the variables have been selected.
+    # (util.open_mfdataset also sets the HDF5 chunk cache size.)
+    reader_kwargs = {}
+    if time_mean|multi_file:
+        reader_kwargs = {
+            "chunks": {"time": 1},
+            "parallel": True,
+            "combine": "by_coords",
+            "data_vars": "minimal",
+            "coords": "minimal",
+            "compat": "override",
+        }
+
     if ref is not None:
-        ref_data = reader(ref, drop_variables=skip_these_vars)
+        ref_data = reader(
+            ref,
+            drop_variables=skip_these_vars,
+            **reader_kwargs
+        )
+        if prefix is not None:
+            ref_data = ref_data[
+                [var for var in ref_data.data_vars if var.startswith(prefix)]
+            ]
         if time_mean:
-            ref_data = util.dataset_mean(ref_data)
-
-    if dev is not None:
-        dev_data = reader(dev, drop_variables=skip_these_vars)
+            ref_data = util.dataset_mean(ref_data).load()
+
+    # If Ref and Dev are the same file(s) (e.g. when checking a
+    # run against itself), only read them once.  NOTE: dev_data
+    # will then be a shallow copy of ref_data, which shares the
+    # underlying data but not the Dataset and Variable objects, so
+    # that assigning new values to one does not change the other.
+    if same_ref_and_dev_files(ref, dev):
+        dev_data = ref_data.copy(deep=False)
+    elif dev is not None:
+        dev_data = reader(
+            dev,
+            drop_variables=skip_these_vars,
+            **reader_kwargs
+        )
+        if prefix is not None:
+            dev_data = dev_data[
+                [var for var in dev_data.data_vars if var.startswith(prefix)]
+            ]
         if time_mean:
-            dev_data = util.dataset_mean(dev_data)
+            dev_data = util.dataset_mean(dev_data).load()
 
     return ref_data, dev_data
 
 
+def same_ref_and_dev_files(
+        ref,
+        dev
+):
+    """
+    Tests if the Ref and Dev data file(s) are the same file(s),
+    e.g. when checking a run against itself.  In this case,
+    read_ref_and_dev only reads the data once.
+
+    Args:
+    -----
+    ref (str|list) : Ref data file(s)
+    dev (str|list) : Dev data file(s)
+
+    Returns:
+    --------
+    same_files (bool) : True if ref and dev are the same file(s)
+    """
+    if ref is None or dev is None:
+        return False
+    if ref == dev:
+        return True
+    return isinstance(ref, str) and isinstance(dev, str) and \
+        os.path.exists(ref) and os.path.exists(dev) and \
+        os.path.samefile(ref, dev)
+
+
 def get_common_varnames(
         refdata,
         devdata,
-        prefix,
+        prefix=None,
         verbose=False,
+        pattern=None,
 ):
     """
     Returns an alphabetically-sorted list of common variables two
-    xr.Dataset objects matching a given prefix.
+    xr.Dataset objects whose names start with a given prefix
+    (or match a given regular expression).
 
     Args
-    refdata : xr.Dataset : Data from the Ref model.
-    devdata : xr.Dataset : Data from the Dev model.
-    prefix  : str        : Variable prefix to match.
-    verbose : bool       : Toggle verbose printout on/off.
+    refdata : xr.Dataset      : Data from the Ref model.
+    devdata : xr.Dataset      : Data from the Dev model.
+    prefix  : str|tuple       : Variable prefix (or prefixes) to match.
+    verbose : bool            : Toggle verbose printout on/off.
+    pattern : str             : Regular expression to match at the
+                                start of variable names (used instead
+                                of prefix if passed).
 
     Returns
-    varlist : list       : Sorted list of common variable names.
+    varlist : list            : Sorted list of common variable names.
     """
-    vardict = util.compare_varnames(refdata, devdata, quiet=not verbose)
-    varlist = [var for var in vardict["commonvars"] if prefix in var]
+    if prefix is None and pattern is None:
+        raise ValueError("Either prefix or pattern must be passed!")
 
-    return sorted(varlist)
+    # Compile the regular expression once, not for every variable
+    if pattern is not None:
+        regex = re.compile(pattern)
+        refvars = {var for var in refdata.data_vars if regex.match(var)}
+        devvars = {var for var in devdata.data_vars if regex.match(var)}
+    else:
+        refvars = {var for var in refdata.data_vars if var.startswith(prefix)}
+        devvars = {var for var in devdata.data_vars if var.startswith(prefix)}
+
+    if verbose:
+        if refvars - devvars:
+            print(f"Variables only in Ref: {sorted(refvars - devvars)}")
+        if devvars - refvars:
+            print(f"Variables only in Dev: {sorted(devvars - refvars)}")
+
+    return sorted(refvars & devvars)
 
 
 def print_sigdiffs(
@@ -312,10 +401,15 @@ def get_geoschem_level_metadata(
     return metadata[search_key]
 
 
+@lru_cache(maxsize=1)
 def get_lumped_species_definitions():
     """
     Returns lumped species definitions from a YAML file.
 
+    The file is parsed only once and the result is cached.  The
+    returned dict is shared between callers, so it should not be
+    modified.
+
     Returns
     lumped_spc_dict : dict : Dictionary of lumped species
     """
@@ -405,35 +499,54 @@ def add_lumped_species_to_dataset(
             lumped_spc[var].name = prefix + spcname
             lumped_spc[var].values = np.full(dummy_shape, 0.0, dtype=dummy_type)
 
-        # Loop over lumped species list
-        for var, lspc in enumerate(lumped_spc):
+        # Scratch array for the scaled values of each constituent
+        # species, so that a new temporary array does not have to be
+        # allocated for every constituent of every lumped species
+        scaled = np.empty(dummy_shape, dtype=dummy_type)
+
+        # Variable names of the constituent species (a species may
+        # be a constituent of several lumped species)
+        varnames = {
+            spcname: prefix + spcname
+            for constituents in lspc_dict.values()
+            for spcname in constituents
+        }
 
-            # Search key for lspc_dict is lspc.name minus the prefix
-            cidx = lspc.name.find("_")
-            key = lspc.name[cidx+1:]
+        # Loop over lumped species list
+        for key, lspc in zip(lspc_dict, lumped_spc):
 
-            # Check if overlap with existing species
-            if lspc.name in dset.data_vars and overwrite:
-                dset.drop(lspc.name)
-            else:
-                assert(lspc.name not in dset.data_vars), \
-                    f"{lspc.name} already in dataset. To overwrite pass overwrite=True."
+            # Check if overlap with existing species.  Existing species
+            # are replaced when the lumped species are assigned to the
+            # Dataset below, so they do not need to be dropped here.
+            assert overwrite or lspc.name not in dset.data_vars, \
+                f"{lspc.name} already in dataset. To overwrite pass overwrite=True."
 
             # Verbose prints
             if verbose:
                 print(f"Creating {lspc.name}")
 
-            # Loop over and sum constituent species values
+            # Loop over and sum constituent species values, weighted
+            # by their scale factors, in place
             num_spc = 0
-            for _, spcname in enumerate(lspc_dict[key]):
-                varname = prefix + spcname
+            lspc_values = lspc.values
+            for spcname, scale in lspc_dict[key].items():
+                varname = varnames[spcname]
                 if varname not in dset.data_vars:
                     if verbose:
-                        print(f"Warning: {varname} needed for {lspc_dict[key][spcname]} not in dataset")
+                        print(f"Warning: {varname} needed for {scale} not in dataset")
                     continue
                 if verbose:
-                    print(f" -> adding {varname} with scale {lspc_dict[key][spcname]}")
-                lspc.values += dset[varname].values * lspc_dict[key][spcname]
+                    print(f" -> adding {varname} with scale {scale}")
+                values = dset[varname].values
+                if values.shape == dummy_shape and values.dtype == dummy_type:
+                    np.multiply(values, scale, out=scaled)
+                    lspc_values += scaled
+                else:
+                    # Constituent does not match the dummy DataArray,
+                    # so let xarray broadcast it onto the lumped species
+                    lspc_values += (dset[varname] * scale).broadcast_like(
+                        lspc
+                    ).transpose(*lspc.dims).values
                 num_spc += 1
 
             # Replace values with NaN if no species found in dataset
@@ -442,10 +555,10 @@ def add_lumped_species_to_dataset(
                     print("No constituent species found! Setting to NaN.")
                 lspc.values = np.full(lspc.shape, np.nan)
 
-        # Insert the DataSet into the list of DataArrays
-        # so that we can only do the merge operation once
-        lumped_spc.insert(0, dset)
-        dset = xr.merge(lumped_spc)
+        # Add all of the lumped species to the Dataset at once.
+        # (Dataset.assign skips the coordinate alignment of xr.merge,
+        # since the lumped species are copies of an existing variable.)
+        dset = dset.assign({lspc.name: lspc for lspc in lumped_spc})
 
     return dset
 
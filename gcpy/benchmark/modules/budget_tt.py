@@ -10,6 +10,7 @@ TransportTracersBenchmark simulations.
 # ======================================================================
 
 import os
+from fnmatch import filter as fnmatch_filter
 from glob import glob
 import warnings
 from calendar import monthrange
@@ -109,60 +110,42 @@ class _GlobVars:
         )
 
         # Diagnostics
-        HemcoDiag = os.path.join(
-            self.devdir,
-            f"HEMCO_diagnostics.{self.y0_str}*.nc"
-        )
+        # List the diagnostic folder once and match each collection
+        # against the listing, instead of globbing the folder once
+        # per collection.
+        with os.scandir(self.devdir) as entries:
+            devfiles = sorted(entry.name for entry in entries)
 
-        DryDep = os.path.join(
-            self.devdir,
-            f"*.DryDep.{self.y0_str}*.nc4"
-        )
+        def dev_files(pattern):
+            return [
+                os.path.join(self.devdir, name)
+                for name in fnmatch_filter(devfiles, pattern)
+            ]
 
-        RadioNucl = os.path.join(
-            self.devdir,
-            f"*.RadioNuclide.{self.y0_str}*.nc4"
-        )
+        HemcoDiag = dev_files(f"HEMCO_diagnostics.{self.y0_str}*.nc")
+
+        DryDep = dev_files(f"*.DryDep.{self.y0_str}*.nc4")
+
+        RadioNucl = dev_files(f"*.RadioNuclide.{self.y0_str}*.nc4")
 
         if is_gchp:
-            StateMetAvg = os.path.join(
-                self.devdir,
-                f"*.StateMet_avg.{self.y0_str}*.nc4"
-            )
+            StateMetAvg = dev_files(f"*.StateMet_avg.{self.y0_str}*.nc4")
 
-            StateMet = os.path.join(
-                self.devdir,
-                f"*.StateMet.{self.y0_str}*.nc4"
-            )
+            StateMet = dev_files(f"*.StateMet.{self.y0_str}*.nc4")
 
             # Set a logical if we need to read StateMet_avg or StateMet
-            gchp_use_statemet_avg  = os.path.exists(StateMetAvg)
+            gchp_use_statemet_avg = len(StateMetAvg) > 0
 
         else:
-            StateMet = os.path.join(
-                self.devdir,
-                f"*.StateMet.{self.y0_str}*.nc4"
-            )
+            StateMet = dev_files(f"*.StateMet.{self.y0_str}*.nc4")
 
-        SpeciesConc = os.path.join(
-            self.devdir,
-            f"*.SpeciesConc.{self.y0_str}*.nc4"
-        )
+        SpeciesConc = dev_files(f"*.SpeciesConc.{self.y0_str}*.nc4")
 
-        WetLossConv = os.path.join(
-            self.devdir,
-            f"*.WetLossConv.{self.y0_str}*.nc4"
-        )
+        WetLossConv = dev_files(f"*.WetLossConv.{self.y0_str}*.nc4")
 
-        WetLossLS = os.path.join(
-            self.devdir,
-            f"*.WetLossLS.{self.y0_str}*.nc4"
-        )
+        WetLossLS = dev_files(f"*.WetLossLS.{self.y0_str}*.nc4")
 
-        GCHPEmiss = os.path.join(
-            self.devdir,
-            f"*.Emissions.{self.y0_str}*.nc4"
-        )
+        GCHPEmiss = dev_files(f"*.Emissions.{self.y0_str}*.nc4")
 
         # ------------------------------
         # Read data collections
@@ -61,3 +61,11 @@ COL_WIDTH = 20
 # ======================================================================
 ENCODING = "UTF-8"
 
+# ======================================================================
+# HDF5 chunk cache settings for reading netCDF files
+# (size in bytes, number of slots).  netCDF-C allocates a cache
+# of this size for each variable, so it only needs to hold a few
+# chunks (a lat/lon slab) of one GEOS-Chem 4-D field.
+# ======================================================================
+CHUNK_CACHE_SIZE = 4 * 1024 * 1024
+CHUNK_CACHE_NELEMS = 1009
@@ -10,8 +10,9 @@ import os
 import sys
 import warnings
 import numpy as np
-from gcpy.util import add_missing_variables, compare_varnames, \
-    dataset_reader, read_config_file, rename_and_flip_gchp_rst_vars
+from gcpy.util import add_missing_variables, compare_stats_all, \
+    compare_varnames, dataset_reader, read_config_file, \
+    rename_and_flip_gchp_rst_vars
 from gcpy.constants import skip_these_vars
 from gcpy.plot.compare_single_level import compare_single_level
 from gcpy.plot.compare_zonal_mean import compare_zonal_mean
@@ -339,6 +340,19 @@ def compare_data(config, data):
             varlist_level
         )
 
+    # ==================================================================
+    # Print global statistics for each quantity
+    # ==================================================================
+    if config["options"].get("global_stats", False):
+        print('... Printing global statistics')
+        compare_stats_all(
+            refdata,
+            config["data"]["ref"]["label"],
+            devdata,
+            config["data"]["dev"]["label"],
+            varlist_level
+        )
+
 
 def main(argv):
     """
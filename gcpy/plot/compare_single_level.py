@@ -21,20 +21,18 @@ from gcpy.grid import get_grid_extents, call_make_grid
 from gcpy.regrid import regrid_comparison_data, create_regridders
 from gcpy.util import reshape_MAPL_CS, get_diff_of_diffs, \
     all_zero_or_nan, slice_by_lev_and_time, compare_varnames, \
-    read_config_file, verify_variable_type
+    read_species_database, verify_variable_type, same_array_data
 from gcpy.units import check_units, data_unit_is_mol_per_mol
 from gcpy.constants import MW_AIR_g
 from gcpy.plot.core import gcpy_style, six_panel_subplot_names, \
     _warning_format, WhGrYlRd
 from gcpy.plot.six_plot import six_plot
 
-# Suppress numpy divide by zero warnings to prevent output spam
-np.seterr(divide="ignore", invalid="ignore")
-
 # Use a style sheet to control plot attributes
 plt.style.use(gcpy_style)
 
 
+@np.errstate(divide="ignore", invalid="ignore")
 def compare_single_level(
         refdata,
         refstr,
@@ -67,6 +65,8 @@ def compare_single_level(
         sg_ref_path='',
         sg_dev_path='',
         ll_plot_func='imshow',
+        bookmarks=None,
+        panel_limits=None,
         **extra_plot_args
 ):
     """
@@ -190,6 +190,20 @@ def compare_single_level(
             faster but is slightly displaced when plotting from
             dateline to dateline and/or pole to pole.
             Default value: 'imshow'
+        bookmarks: list of str
+            Bookmark names (one per variable in varlist) to add
+            to the PDF file as the pages are merged.
+            Default value: None (will not add bookmarks)
+        panel_limits: dict
+            Precomputed color bar limits for the Ref and Dev panels,
+            as (vmin_ref, vmax_ref, vmin_dev, vmax_dev) for each
+            variable in varlist, in the units of the input data.
+            Ignored if extent, normalize_by_area, convert_to_ugm3, or
+            second_ref/second_dev is passed, and for variables whose units are converted
+            from mol/mol to ppb, since the limits would then no longer
+            match the plotted data.
+            Default value: None (will compute the limits for each
+            variable within the plot extent)
         extra_plot_args: various
             Any extra keyword arguments are passed through the
             plotting functions to be used in calls to pcolormesh() (CS)
@@ -209,6 +223,18 @@ def compare_single_level(
     # Determine if doing diff-of-diffs
     diff_of_diffs = second_ref is not None and second_dev is not None
 
+    # Precomputed panel limits only apply to the full domain of the
+    # input data, in its input units
+    if panel_limits is not None:
+        if -1000 not in extent or normalize_by_area or convert_to_ugm3 \
+           or diff_of_diffs:
+            msg = "panel_limits is ignored when extent, normalize_by_area, " \
+                  "convert_to_ugm3, or second_ref/second_dev is passed"
+            warnings.warn(msg)
+            panel_limits = None
+        else:
+            panel_limits = dict(panel_limits)
+
     # Prepare diff-of-diffs datasets if needed
     if diff_of_diffs:
         refdata, devdata = refdata.load(), devdata.load()
@@ -240,13 +266,7 @@ def compare_single_level(
     if pdfname == "":
         savepdf = False
     if convert_to_ugm3:
-        properties = read_config_file(
-            os.path.join(
-                spcdb_dir,
-                "species_database.yml"
-            ),
-            quiet=True
-        )
+        properties = read_species_database(spcdb_dir)
 
     sg_ref_params = [1, 170, -90]
     sg_dev_params = [1, 170, -90]
@@ -358,6 +378,12 @@ def compare_single_level(
         # ==================================================================
 
         # Convert to ppb if units string is variation of mol/mol
+        # (precomputed panel limits are then in the wrong units)
+        if panel_limits is not None and (
+                data_unit_is_mol_per_mol(ds_refs[i]) or
+                data_unit_is_mol_per_mol(ds_devs[i])
+        ):
+            panel_limits.pop(varname, None)
         if data_unit_is_mol_per_mol(ds_refs[i]):
             ds_refs[i].values = ds_refs[i].values * 1e9
             ds_refs[i].attrs["units"] = "ppb"
@@ -628,11 +654,52 @@ def compare_single_level(
                 cmpminlon_ind,
                 cmpmaxlon_ind
             )
+    # =================================================================
+    # Set the map projection and colormaps, which are the same for
+    # every page, once instead of for each variable.
+    #
+    # Use shallow copy (copy.copy() to create color map objects,
+    # in order to avoid set_bad() from being applied to the base
+    # color table. See: https://docs.python.org/3/library/copy.html
+    # =================================================================
+    if extent[0] > extent[1]:
+        proj = ccrs.PlateCarree(central_longitude=180)
+    else:
+        proj = ccrs.PlateCarree()
+
+    # Colormaps for 1st row (Ref and Dev)
+    if use_cmap_RdBu:
+        cmap_toprow_nongray = copy.copy(mpl.colormaps["RdBu_r"])
+        cmap_toprow_gray = copy.copy(mpl.colormaps["RdBu_r"])
+    else:
+        cmap_toprow_nongray = copy.copy(WhGrYlRd)
+        cmap_toprow_gray = copy.copy(WhGrYlRd)
+    cmap_toprow_gray.set_bad(color="gray")
+
+    # Colormaps for 2nd row (Abs. Diff.) and 3rd row (Frac. Diff,)
+    cmap_nongray = copy.copy(mpl.colormaps["RdBu_r"])
+    cmap_gray = copy.copy(mpl.colormaps["RdBu_r"])
+    cmap_gray.set_bad(color="gray")
+
     # =================================================================
     # Define function to create a single page figure to be called
-    # in a parallel loop
+    # in a parallel loop.  The data for each variable is passed as
+    # arguments rather than read from the lists above, so that each
+    # parallel task only sends its own variable to the worker (and
+    # joblib can memory-map large arrays instead of copying them).
     # =================================================================
-    def createfig(ivar, temp_dir=''):
+    @np.errstate(divide="ignore", invalid="ignore")
+    def createfig(
+            ivar,
+            ds_ref,
+            ds_dev,
+            ds_ref_cmp,
+            ds_dev_cmp,
+            frac_ds_ref_cmp,
+            frac_ds_dev_cmp,
+            ref_is_dev=False,
+            temp_dir=''
+    ):
 
         # Suppress harmless run-time warnings (mostly about underflow)
         warnings.filterwarnings('ignore', category=RuntimeWarning)
@@ -642,9 +709,6 @@ def compare_single_level(
             print(f"{ivar} ", end="")
         varname = varlist[ivar]
 
-        ds_ref = ds_refs[ivar]
-        ds_dev = ds_devs[ivar]
-
         # ==============================================================
         # Set units and subtitle, including modification if normalizing
         # area. Note if enforce_units is False (non-default) then
@@ -675,11 +739,6 @@ def compare_single_level(
         if devgridtype == "cs":
             ds_dev_reshaped = ds_dev.data.reshape(6, devres, devres)
 
-        ds_ref_cmp = ds_ref_cmps[ivar]
-        ds_dev_cmp = ds_dev_cmps[ivar]
-        frac_ds_ref_cmp = frac_ds_ref_cmps[ivar]
-        frac_ds_dev_cmp = frac_ds_dev_cmps[ivar]
-
         # Reshape comparison cubed sphere data, if any
         if cmpgridtype == "cs":
             def call_reshape(cmp_data):
@@ -738,28 +797,32 @@ def compare_single_level(
                 where(ds_new[lat_var].compute() >= minlat, drop=True).\
                 where(ds_new[lat_var].compute() <= maxlat, drop=True)
 
-        ds_ref_reg = get_extent_for_colors(
-            ds_ref,
-            min_max_minlon,
-            min_max_maxlon,
-            min_max_minlat,
-            min_max_maxlat
-        )
-        ds_dev_reg = get_extent_for_colors(
-            ds_dev,
-            min_max_minlon,
-            min_max_maxlon,
-            min_max_minlat,
-            min_max_maxlat
-        )
+        # Use precomputed Ref and Dev limits if they were passed
+        if panel_limits is not None and varname in panel_limits:
+            vmin_ref, vmax_ref, vmin_dev, vmax_dev = panel_limits[varname]
+        else:
+            ds_ref_reg = get_extent_for_colors(
+                ds_ref,
+                min_max_minlon,
+                min_max_maxlon,
+                min_max_minlat,
+                min_max_maxlat
+            )
+            ds_dev_reg = get_extent_for_colors(
+                ds_dev,
+                min_max_minlon,
+                min_max_maxlon,
+                min_max_minlat,
+                min_max_maxlat
+            )
 
-        # Ref
-        vmin_ref = float(np.nanmin(ds_ref_reg.data))
-        vmax_ref = float(np.nanmax(ds_ref_reg.data))
+            # Ref
+            vmin_ref = float(np.nanmin(ds_ref_reg.data))
+            vmax_ref = float(np.nanmax(ds_ref_reg.data))
 
-        # Dev
-        vmin_dev = float(np.nanmin(ds_dev_reg.data))
-        vmax_dev = float(np.nanmax(ds_dev_reg.data))
+            # Dev
+            vmin_dev = float(np.nanmin(ds_dev_reg.data))
+            vmax_dev = float(np.nanmax(ds_dev_reg.data))
 
 # Pylint says that these are unused variables, so comment out
 #  -- Bob Yantosca (15 Aug 2023)
@@ -791,9 +854,18 @@ def compare_single_level(
         # Calculate absolute difference
         # ==============================================================
         if cmpgridtype == "ll":
-            absdiff = np.array(ds_dev_cmp) - np.array(ds_ref_cmp)
+            ref_cmp_data = np.asarray(ds_ref_cmp)
+            dev_cmp_data = np.asarray(ds_dev_cmp)
         else:
-            absdiff = ds_dev_cmp_reshaped - ds_ref_cmp_reshaped
+            ref_cmp_data = ds_ref_cmp_reshaped
+            dev_cmp_data = ds_dev_cmp_reshaped
+        # If Ref and Dev are the same data (e.g. when a file is
+        # compared against itself), Dev - Ref is zero wherever Ref
+        # is finite and NaN elsewhere, which is just Ref * 0.
+        if ref_is_dev:
+            absdiff = ref_cmp_data * 0.0
+        else:
+            absdiff = dev_cmp_data - ref_cmp_data
         # Test if the abs. diff. is zero everywhere or NaN everywhere
         absdiff_is_all_zero, absdiff_is_all_nan = all_zero_or_nan(absdiff)
         # For cubed-sphere, take special care to avoid a spurious
@@ -807,22 +879,24 @@ def compare_single_level(
         # ==============================================================
         # Calculate fractional difference, set divides by zero to NaN
         # ==============================================================
-        if cmpgridtype == "ll":
+        if frac_ds_dev_cmp is not None and frac_ds_ref_cmp is not None:
             # Replace fractional difference plots with absolute difference
             # of fractional datasets if necessary
-            if frac_ds_dev_cmp is not None and frac_ds_ref_cmp is not None:
+            if cmpgridtype == "ll":
                 fracdiff = np.array(frac_ds_dev_cmp) -       \
                     np.array(frac_ds_ref_cmp)
             else:
-                fracdiff = np.abs(np.array(ds_dev_cmp)) /    \
-                    np.abs(np.array(ds_ref_cmp))
-        else:
-            if frac_ds_dev_cmp is not None and frac_ds_ref_cmp is not None:
                 fracdiff = frac_ds_dev_cmp_reshaped -        \
                     frac_ds_ref_cmp_reshaped
-            else:
-                fracdiff = np.abs(ds_dev_cmp_reshaped) /     \
-                    np.abs(ds_ref_cmp_reshaped)
+        elif ref_is_dev:
+            # Dev/Ref is 1 wherever Ref is finite and nonzero
+            fracdiff = np.where(
+                np.isfinite(ref_cmp_data) & (ref_cmp_data != 0),
+                1.0,
+                np.nan
+            )
+        else:
+            fracdiff = np.abs(dev_cmp_data) / np.abs(ref_cmp_data)
 
         # Replace Infinity values with NaN
         fracdiff = np.where(np.abs(fracdiff) == np.inf, np.nan, fracdiff)
@@ -847,11 +921,6 @@ def compare_single_level(
         # ==============================================================
 
         # Create figures and axes objects
-        # Also define the map projection that will be shown
-        if extent[0] > extent[1]:
-            proj = ccrs.PlateCarree(central_longitude=180)
-        else:
-            proj = ccrs.PlateCarree()
         figs, ((ax0, ax1), (ax2, ax3), (ax4, ax5)) = plt.subplots(
             3, 2, figsize=[12, 14],
             subplot_kw={"projection": proj}
@@ -898,21 +967,9 @@ def compare_single_level(
 
         # ==============================================================
         # Set colormaps for data plots
-        #
-        # Use shallow copy (copy.copy() to create color map objects,
-        # in order to avoid set_bad() from being applied to the base
-        # color table. See: https://docs.python.org/3/library/copy.html
         # ==============================================================
 
         # Colormaps for 1st row (Ref and Dev)
-        if use_cmap_RdBu:
-            cmap_toprow_nongray = copy.copy(mpl.colormaps["RdBu_r"])
-            cmap_toprow_gray = copy.copy(mpl.colormaps["RdBu_r"])
-        else:
-            cmap_toprow_nongray = copy.copy(WhGrYlRd)
-            cmap_toprow_gray = copy.copy(WhGrYlRd)
-        cmap_toprow_gray.set_bad(color="gray")
-
         if refgridtype == "ll":
             if ref_is_all_nan:
                 ref_cmap = cmap_toprow_gray
@@ -924,11 +981,6 @@ def compare_single_level(
             else:
                 dev_cmap = cmap_toprow_nongray
 
-        # Colormaps for 2nd row (Abs. Diff.) and 3rd row (Frac. Diff,)
-        cmap_nongray = copy.copy(mpl.colormaps["RdBu_r"])
-        cmap_gray = copy.copy(mpl.colormaps["RdBu_r"])
-        cmap_gray.set_bad(color="gray")
-
         # ==============================================================
         # Set titles for plots
         # ==============================================================
@@ -1137,10 +1189,28 @@ def compare_single_level(
     if current_process().name != "MainProcess":
         n_job = 1
 
+    # Test if Ref and Dev are the same array in memory here, since
+    # the parallel workers receive separate copies of the arrays
+    ref_is_devs = [
+        same_array_data(ref_cmp, dev_cmp)
+        for ref_cmp, dev_cmp in zip(ds_ref_cmps, ds_dev_cmps)
+    ]
+
+    # Data arguments for each call to createfig
+    fig_args = list(zip(
+        ds_refs,
+        ds_devs,
+        ds_ref_cmps,
+        ds_dev_cmps,
+        frac_ds_ref_cmps,
+        frac_ds_dev_cmps,
+        ref_is_devs
+    ))
+
     if not savepdf:
         # disable parallel plotting to allow interactive figure plotting
         for i in range(n_var):
-            createfig(i)
+            createfig(i, *fig_args[i])
 
     else:
         with TemporaryDirectory() as temp_dir:
@@ -1148,13 +1218,15 @@ def compare_single_level(
             # Turn off parallelization if n_job=1
             if n_job != 1:
                 results = Parallel(n_jobs=n_job)(
-                    delayed(createfig)(i, temp_dir)
+                    delayed(createfig)(i, *fig_args[i], temp_dir=temp_dir)
                     for i in range(n_var)
                 )
             else:
                 results = []
                 for i in range(n_var):
-                    results.append(createfig(i, temp_dir))
+                    results.append(
+                        createfig(i, *fig_args[i], temp_dir=temp_dir)
+                    )
             # ---------------------------------------
 
             # update sig diffs after parallel calls
@@ -1176,12 +1248,18 @@ def compare_single_level(
                 temp_pdfname = pdfname
                 if pdfname[0] == '/':
                     temp_pdfname = temp_pdfname[1:]
+                outline_item = None
+                if bookmarks is not None:
+                    outline_item = bookmarks[i]
                 merge.append(
                     os.path.join(
                         str(temp_dir),
                         temp_pdfname +
                         "BENCHMARKFIGCREATION.pdf" +
-                        str(i)))
+                        str(i)),
+                    outline_item=outline_item)
+            if bookmarks is not None:
+                merge.set_page_mode("/UseOutlines")
             merge.write(pdfname)
             merge.close()
             warnings.showwarning = _warning_format
@@ -21,20 +21,18 @@ from gcpy.regrid import regrid_comparison_data, create_regridders, gen_xmat, \
     regrid_vertical
 from gcpy.util import reshape_MAPL_CS, get_diff_of_diffs, \
     all_zero_or_nan, compare_varnames, \
-    read_config_file, verify_variable_type
+    read_species_database, verify_variable_type
 from gcpy.units import check_units, data_unit_is_mol_per_mol
 from gcpy.constants import MW_AIR_g
 from gcpy.plot.core import gcpy_style, six_panel_subplot_names, \
     _warning_format, WhGrYlRd
 from gcpy.plot.six_plot import six_plot
 
-# Suppress numpy divide by zero warnings to prevent output spam
-np.seterr(divide="ignore", invalid="ignore")
-
 # Use a style sheet to control plot attributes
 plt.style.use(gcpy_style)
 
 
+@np.errstate(divide="ignore", invalid="ignore")
 def compare_zonal_mean(
         refdata,
         refstr,
@@ -254,13 +252,7 @@ def compare_zonal_mean(
         savepdf = False
     # If converting to ug/m3, load the species database
     if convert_to_ugm3:
-        properties = read_config_file(
-            os.path.join(
-                spcdb_dir,
-                "species_database.yml"
-            ),
-            quiet=True
-        )
+        properties = read_species_database(spcdb_dir)
 
     # Get mid-point pressure and edge pressures for this grid
     ref_pedge, ref_pmid, _ = get_vert_grid(refdata, *ref_vert_params)
@@ -670,6 +662,7 @@ def compare_zonal_mean(
     # Define function to create a single page figure to be called
     # in a parallel loop
     # ==================================================================
+    @np.errstate(divide="ignore", invalid="ignore")
     def createfig(ivar, temp_dir=''):
 
         # Suppress harmless run-time warnings (mostly about underflow)
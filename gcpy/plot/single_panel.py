@@ -16,13 +16,11 @@ from gcpy.regrid import regrid_comparison_data, create_regridders
 from gcpy.util import reshape_MAPL_CS, all_zero_or_nan, verify_variable_type
 from gcpy.plot.core  import gcpy_style, normalize_colors, WhGrYlRd
 
-# Suppress numpy divide by zero warnings to prevent output spam
-np.seterr(divide="ignore", invalid="ignore")
-
 # Use a style sheet to control plot attributes
 plt.style.use(gcpy_style)
 
 
+@np.errstate(divide="ignore", invalid="ignore")
 def single_panel(
         plot_vals,
         ax=None,
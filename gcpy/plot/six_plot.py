@@ -21,13 +21,11 @@ from gcpy.util import get_nan_mask, verify_variable_type
 from gcpy.plot.core import gcpy_style, normalize_colors
 from gcpy.plot.single_panel import single_panel
 
-# Suppress numpy divide by zero warnings to prevent output spam
-np.seterr(divide="ignore", invalid="ignore")
-
 # Use a style sheet to control plot attributes
 plt.style.use(gcpy_style)
 
 
+@np.errstate(divide="ignore", invalid="ignore")
 def six_plot(
         subplot,
         all_zero,
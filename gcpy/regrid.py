@@ -474,11 +474,22 @@ def create_regridders(
     [refgrid, _] = call_make_grid(
         refres, refgridtype, ref_extent, cmp_extent, sg_ref_params)
 
-    [devgrid, _] = call_make_grid(
-        devres, devgridtype, dev_extent, cmp_extent, sg_dev_params)
+    # Reuse the Ref grid for Dev and comparison grids that are
+    # identical to it (the common case of same-resolution benchmarks),
+    # rather than building the same grid again.
+    if devres == refres and devgridtype == refgridtype and \
+       dev_extent == ref_extent and sg_dev_params == sg_ref_params:
+        devgrid = refgrid.copy()
+    else:
+        [devgrid, _] = call_make_grid(
+            devres, devgridtype, dev_extent, cmp_extent, sg_dev_params)
 
-    [cmpgrid, _] = call_make_grid(
-        cmpres, cmpgridtype, cmp_extent, cmp_extent, sg_cmp_params)
+    if cmpres == refres and cmpgridtype == refgridtype and \
+       cmp_extent == ref_extent and sg_cmp_params == sg_ref_params:
+        cmpgrid = refgrid.copy()
+    else:
+        [cmpgrid, _] = call_make_grid(
+            cmpres, cmpgridtype, cmp_extent, cmp_extent, sg_cmp_params)
 
     # =================================================================
     # Make regridders, if applicable
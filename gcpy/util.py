@@ -3,14 +3,24 @@ Internal utilities for helping to manage xarray and numpy
 objects used throughout GCPy
 """
 import os
+from functools import lru_cache
+from glob import has_magic
 from shutil import copyfile
 import warnings
 from textwrap import wrap
-from yaml import safe_load
+from yaml import safe_load, load as yaml_load
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 import numpy as np
 import xarray as xr
+import netCDF4
+from dask import compute as dask_compute
+from dask.array import Array as DaskArray
 from pypdf import PdfWriter, PdfReader
-from gcpy.constants import ENCODING, TABLE_WIDTH
+from gcpy.constants import ENCODING, TABLE_WIDTH, \
+    CHUNK_CACHE_SIZE, CHUNK_CACHE_NELEMS
 from gcpy.cstools import is_cubed_sphere_rst_grid
 
 # ======================================================================
@@ -882,65 +892,65 @@ def compare_varnames(
     verify_variable_type(refdata, xr.Dataset)
     verify_variable_type(devdata, xr.Dataset)
 
-    refvars = list(refdata.data_vars.keys())
-    devvars = list(devdata.data_vars.keys())
-    commonvars = sorted(list(set(refvars).intersection(set(devvars))))
+    # Use the dict-like views of the variable names, which support
+    # set operations and fast membership tests
+    refvars = refdata.data_vars.keys()
+    devvars = devdata.data_vars.keys()
+    commonvars = sorted(refvars & devvars)
     refonly = [var for var in refvars if var not in devvars]
     devonly = [var for var in devvars if var not in refvars]
-    dimmismatch = [v for v in commonvars if refdata[v].ndim != devdata[v].ndim]
+
+    # Sort the common variables into categories in a single pass,
+    # looking up each variable in refdata and devdata only once.
     # Assume plottable data has lon and lat
     # This is OK for purposes of benchmarking
     #  -- Bob Yantosca (09 Feb 2023)
-    commonvars_data = [
-        var for var in commonvars if (
-            ("lat" in refdata[var].dims or "Ydim" in refdata[var].dims)
-            and
-            ("lon" in refdata[var].dims or "Xdim" in refdata[var].dims)
-        )
-    ]
-    commonvars_other = [
-        var for var in commonvars if (
-           var not in commonvars_data
-        )
-    ]
-    commonvars_2d = [
-        var for var in commonvars if (
-            (var in commonvars_data) and ("lev" not in refdata[var].dims)
-        )
-    ]
-    commonvars_3d = [
-        var for var in commonvars if (
-            (var in commonvars_data) and ("lev" in refdata[var].dims)
-        )
-    ]
+    dimmismatch = []
+    commonvars_data = []
+    commonvars_other = []
+    commonvars_2d = []
+    commonvars_3d = []
+    for var in commonvars:
+        ref_dims = refdata[var].dims
+        if len(ref_dims) != devdata[var].ndim:
+            dimmismatch.append(var)
+        if ("lat" in ref_dims or "Ydim" in ref_dims) and \
+           ("lon" in ref_dims or "Xdim" in ref_dims):
+            commonvars_data.append(var)
+            if "lev" in ref_dims:
+                commonvars_3d.append(var)
+            else:
+                commonvars_2d.append(var)
+        else:
+            commonvars_other.append(var)
 
     # Print information on common and mismatching variables,
     # as well as dimensions
     if not quiet:
         print("\nComparing variable names in compare_varnames")
         print(f"{len(commonvars)} common variables")
-        if len(refonly) > 0:
+        if refonly:
             print(f"{len(refonly)} variables in ref only (skip)")
             print(f"   Variable names: {refonly}")
         else:
             print("0 variables in ref only")
-            if len(devonly) > 0:
-                print(f"len({devonly} variables in dev only (skip)")
-                print(f"   Variable names: {devonly}")
-            else:
-                print("0 variables in dev only")
-                if len(dimmismatch) > 0:
-                    print(f"{dimmismatch} common variables have different dimensions")
-                    print(f"   Variable names: {dimmismatch}")
-                else:
-                    print("All variables have same dimensions in ref and dev")
+        if devonly:
+            print(f"{len(devonly)} variables in dev only (skip)")
+            print(f"   Variable names: {devonly}")
+        else:
+            print("0 variables in dev only")
+        if dimmismatch:
+            print(f"{len(dimmismatch)} common variables have different dimensions")
+            print(f"   Variable names: {dimmismatch}")
+        else:
+            print("All variables have same dimensions in ref and dev")
 
     # For safety's sake, remove the 0-D and 1-D variables from
     # commonvarsData, refonly, and devonly.  This will ensure that
     # these lists will only contain variables that can be plotted.
-    commonvars_data = [var for var in commonvars if var not in commonvars_other]
-    refonly = [var for var in refonly if var not in commonvars_other]
-    devonly = [var for var in devonly if var not in commonvars_other]
+    is_other = set(commonvars_other)
+    refonly = [var for var in refonly if var not in is_other]
+    devonly = [var for var in devonly if var not in is_other]
 
     return {
         "commonvars": commonvars,
@@ -973,28 +983,114 @@ def compare_stats(refdata, refstr, devdata, devstr, varname):
             Variable name for which global statistics will be printed out.
     """
 
-    refvar = refdata[varname]
-    devvar = devdata[varname]
-    units = refdata[varname].units
-    print("Data units:")
-    print(f"    {refstr}:  {units}")
-    print(f"    {devstr}:  {units}")
-    print("Array sizes:")
-    print(f"    {refstr}:  {refvar.shape}")
-    print(f"    {devstr}:  {devvar.shape}")
-    print("Global stats:")
-    print("  Mean:")
-    print(f"    {refstr}:  {np.round(refvar.values.mean(), 20)}")
-    print(f"    {devstr}:  {np.round(devvar.values.mean(), 20)}")
-    print("  Min:")
-    print(f"    {refstr}:  {np.round(refvar.values.min(), 20)}")
-    print(f"    {devstr}:  {np.round(devvar.values.min(), 20)}")
-    print("  Max:")
-    print(f"    {refstr}:  {np.round(refvar.values.max(), 20)}")
-    print(f"    {devstr}:  {np.round(devvar.values.max(), 20)}")
-    print("  Sum:")
-    print(f"    {refstr}:  {np.round(refvar.values.sum(), 20)}")
-    print(f"    {devstr}:  {np.round(devvar.values.sum(), 20)}")
+    compare_stats_all(refdata, refstr, devdata, devstr, [varname])
+
+
+def compare_stats_all(refdata, refstr, devdata, devstr, varnames):
+    """
+    Prints out global statistics (array sizes, mean, min, max, sum)
+    for several variables from two xarray Dataset objects.  The
+    statistics of all variables are computed together, so that for
+    dask-backed data the files are only read once.
+
+    Args:
+        refdata: xarray Dataset
+            The first Dataset to be compared.
+            (This is often referred to as the "Reference" Dataset.)
+        refstr: str
+            Label for refdata to be used in the printout
+        devdata: xarray Dataset
+            The second Dataset to be compared.
+            (This is often referred to as the "Development" Dataset.)
+        devstr: str
+            Label for devdata to be used in the printout
+        varnames: list of str
+            Variable names for which global statistics will be printed out.
+    """
+
+    def global_stats(dvar):
+        """
+        Returns the mean, min, max, and sum of a DataArray.  The data
+        is only converted to a numpy array once.  For dask-backed
+        data, the reductions are returned unevaluated.
+        """
+        data = dvar.data
+        if not isinstance(data, DaskArray):
+            data = np.asarray(data)
+        return (data.mean(), data.min(), data.max(), data.sum())
+
+    # Evaluate the reductions for all variables in a single pass of
+    # the dask scheduler (numpy results are passed through as is)
+    stats = dask_compute(*[
+        (global_stats(refdata[varname]), global_stats(devdata[varname]))
+        for varname in varnames
+    ])
+
+    for varname, (ref_stats, dev_stats) in zip(varnames, stats):
+        refvar = refdata[varname]
+        devvar = devdata[varname]
+        ref_mean, ref_min, ref_max, ref_sum = ref_stats
+        dev_mean, dev_min, dev_max, dev_sum = dev_stats
+        units = refvar.units
+        print("Data units:")
+        print(f"    {refstr}:  {units}")
+        print(f"    {devstr}:  {units}")
+        print("Array sizes:")
+        print(f"    {refstr}:  {refvar.shape}")
+        print(f"    {devstr}:  {devvar.shape}")
+        print("Global stats:")
+        print("  Mean:")
+        print(f"    {refstr}:  {np.round(ref_mean, 20)}")
+        print(f"    {devstr}:  {np.round(dev_mean, 20)}")
+        print("  Min:")
+        print(f"    {refstr}:  {np.round(ref_min, 20)}")
+        print(f"    {devstr}:  {np.round(dev_min, 20)}")
+        print("  Max:")
+        print(f"    {refstr}:  {np.round(ref_max, 20)}")
+        print(f"    {devstr}:  {np.round(dev_max, 20)}")
+        print("  Sum:")
+        print(f"    {refstr}:  {np.round(ref_sum, 20)}")
+        print(f"    {devstr}:  {np.round(dev_sum, 20)}")
+
+
+# bpch categories whose netCDF names are the netCDF id
+# and the last token of the bpch name, joined by "_"
+_BPCH_APPEND_UNDERSCORE = frozenset({
+    "IJ_AVG_S_",
+    "RN_DECAY_",
+    "WETDCV_S_",
+    "WETDLS_S_",
+    "BXHGHT_S_",
+    "DAO_3D_S_",
+    "DAO_FLDS_",
+    "PL_SUL_",
+    "CV_FLX_S_",
+    "EW_FLX_S_",
+    "NS_FLX_S_",
+    "UP_FLX_S_",
+    "MC_FRC_S_",
+})
+
+# DAO_FLDS fields that would cause conflicts w/ netCDF names
+_BPCH_SKIP_FIELDS = frozenset({
+    "DAO_FLDS_PS_PBL",
+    "DAO_FLDS_TROPPRAW",
+})
+
+# bpch categories with special handling.  Each handler takes
+# the netCDF id and the last token of the bpch name, and
+# returns the netCDF name.
+_BPCH_APPEND_HANDLERS = {
+    # J-values: The bpch variable names all begin with "J"
+    # (e.g. JNO, JACET), so strip the first character of the
+    # variable name manually (bmy, 4/8/19)
+    "JV_MAP_S_": lambda newid, varstr: newid + "_" + varstr[1:],
+    "IJ_SOA_S_": lambda newid, varstr: newid + varstr,
+    "BIOBSRCE_": lambda newid, varstr: "Emis" + varstr + "_" + newid,
+    "BIOFSRCE_": lambda newid, varstr: "Emis" + varstr + "_" + newid,
+    "BIOGSRCE_": lambda newid, varstr: "Emis" + varstr + "_" + newid,
+    "ANTHSRCE_": lambda newid, varstr: "Emis" + varstr + "_" + newid,
+}
 
 
 def convert_bpch_names_to_netcdf_names(
@@ -1027,13 +1123,7 @@ def convert_bpch_names_to_netcdf_names(
     # Names dictionary (key = bpch id, value[0] = netcdf id,
     # value[1] = action to create full name using id)
     # Now read from YAML file (bmy, 4/5/19)
-    names = read_config_file(
-        os.path.join(
-            os.path.dirname(__file__),
-            "bpch_to_nc_names.yml"
-        ),
-        quiet=True
-    )
+    names = read_bpch_to_nc_names()
 
     # define some special variable to overwrite above
     special_vars = {
@@ -1069,6 +1159,16 @@ def convert_bpch_names_to_netcdf_names(
         "574nm",
     ]
 
+    # Rank of each bpch name in the YAML file, and the lengths of the
+    # bpch names.  bpch variable names begin with the bpch name
+    # (e.g. IJ_AVG_S_O3), so these are used to look up the prefixes
+    # of each variable name in the names dictionary, instead of
+    # testing each of the (several hundred) bpch names against the
+    # variable name.  If several bpch names match, use the one
+    # listed first.
+    name_rank = {key: rank for rank, key in enumerate(names)}
+    name_lengths = sorted({len(key) for key in names})
+
     # Python dictionary for variable name replacement
     old_to_new = {}
 
@@ -1089,17 +1189,21 @@ def convert_bpch_names_to_netcdf_names(
         oldid = ""
         newid = ""
         idaction = ""
-        for key in names:
-            if key in variable_name:
-                if names[key][1] == "skip":
-                    # Verbose output
-                    if verbose:
-                        print(f"WARNING: skipping {key}")
-                else:
-                    oldid = key
-                    newid = names[key][0]
-                    idaction = names[key][1]
-                break
+        matches = [
+            variable_name[:length]
+            for length in name_lengths
+            if variable_name[:length] in name_rank
+        ]
+        if matches:
+            key = min(matches, key=name_rank.get)
+            if names[key][1] == "skip":
+                # Verbose output
+                if verbose:
+                    print(f"WARNING: skipping {key}")
+            else:
+                oldid = key
+                newid = names[key][0]
+                idaction = names[key][1]
 
         # Go to the next line if no definition was found
         if oldid == "" or newid == "" or idaction == "":
@@ -1111,59 +1215,30 @@ def convert_bpch_names_to_netcdf_names(
 
             # Update the dictionary of names with this pair
             # Use the original variable name.
-            old_to_new.update({original_variable_name: newvar})
+            old_to_new[original_variable_name] = newvar
 
         # For all the rest:
         else:
-            linearr = variable_name.split("_")
-            varstr = linearr[-1]
+            varstr = variable_name.rpartition("_")[2]
 
-            # These categories use append
-            if oldid in [
-                    "IJ_AVG_S_",
-                    "RN_DECAY_",
-                    "WETDCV_S_",
-                    "WETDLS_S_",
-                    "BXHGHT_S_",
-                    "DAO_3D_S_",
-                    "PL_SUL_",
-                    "CV_FLX_S_",
-                    "EW_FLX_S_",
-                    "NS_FLX_S_",
-                    "UP_FLX_S_",
-                    "MC_FRC_S_",
-            ]:
-                newvar = newid + "_" + varstr
+            # Categories with special handling
+            handler = _BPCH_APPEND_HANDLERS.get(oldid)
+            if handler is not None:
+                newvar = handler(newid, varstr)
 
-            # DAO_FLDS
+            # These categories use append
             # Skip certain fields that will cause conflicts w/ netCDF
-            elif oldid in "DAO_FLDS_":
-                if oldid in ["DAO_FLDS_PS_PBL", "DAO_FLDS_TROPPRAW"]:
-
-                    # Verbose output
+            elif oldid in _BPCH_APPEND_UNDERSCORE:
+                if oldid in _BPCH_SKIP_FIELDS:
                     if verbose:
                         print(f"Skipping: {oldid}")
-                else:
-                    newvar = newid + "_" + varstr
-
-            # Special handling for J-values: The bpch variable names all
-            # begin with "J" (e.g. JNO, JACET), so we need to strip the first
-            # character of the variable name manually (bmy, 4/8/19)
-            elif oldid == "JV_MAP_S_":
-                newvar = newid + "_" + varstr[1:]
-
-            # IJ_SOA_S_
-            elif oldid == "IJ_SOA_S_":
-                newvar = newid + varstr
+                    continue
+                newvar = newid + "_" + varstr
 
             # DRYD_FLX_, DRYD_VEL_
             elif "DRYD_" in oldid:
                 newvar = newid + "_" + varstr[:-2]
 
-            # BIOBSRCE_, BIOFSRCE_, BIOGSRCE_. ANTHSRCE_
-            elif oldid in ["BIOBSRCE_", "BIOFSRCE_", "BIOGSRCE_", "ANTHSRCE_"]:
-                newvar = "Emis" + varstr + "_" + newid
-
             # Special handling for UV radiative flux diagnostics:
             # We need to append the bin descriptor to the new name.
             elif "FJX_FLXS" in oldid:
@@ -1183,7 +1258,7 @@ def convert_bpch_names_to_netcdf_names(
                 newvar = special_vars.get(newvar)
 
             # Update the dictionary of names with this pair
-            old_to_new.update({original_variable_name: newvar})
+            old_to_new[original_variable_name] = newvar
 
     # Verbose output
     if verbose:
@@ -1191,11 +1266,16 @@ def convert_bpch_names_to_netcdf_names(
         for key in old_to_new:
             print(f"{key : <25} ==> {old_to_new[key] : <40}")
 
-    # Rename the variables in the dataset
+    # Rename the variables in the dataset (skip names that
+    # are unchanged, since these would be no-op renames)
     if verbose:
         print("\nRenaming variables in the data...")
-    with xr.set_options(keep_attrs=True):
-        dset = dset.rename(name_dict=old_to_new)
+    old_to_new = {
+        old: new for old, new in old_to_new.items() if old != new
+    }
+    if old_to_new:
+        with xr.set_options(keep_attrs=True):
+            dset = dset.rename(old_to_new)
 
     # Return the dataset
     return dset
@@ -1224,7 +1304,7 @@ def filter_names(
 
     if text != "":
         return [var for var in names if text in var]
-    return [var for var in names if var]
+    return list(names)
 
 
 def divide_dataset_by_dataarray(
@@ -1275,11 +1355,9 @@ def divide_dataset_by_dataarray(
     # Keep all Dataset attributes
     with xr.set_options(keep_attrs=True):
 
-        # Loop over variables
-        for var in varlist:
-
-            # Divide each variable of ds by dr
-            dset[var] = dset[var] / darr
+        # Divide all selected variables of ds by dr in a single
+        # (broadcast) operation, then replace them in the Dataset
+        dset = dset.assign(dset[list(varlist)] / darr)
 
     return dset
 
@@ -1950,6 +2028,103 @@ def dataset_mean(
         return dset.mean(dim=dim, skipna=skipna)
 
 
+# Functions to open a single file or store, by file extension.
+# Files with other extensions are opened with xr.open_dataset.
+_DATASET_OPENERS = {
+    ".nc": xr.open_dataset,
+    ".nc4": xr.open_dataset,
+    ".zarr": xr.open_zarr,
+}
+
+
+def open_mfdataset(
+        paths,
+        chunks="auto",
+        parallel=True,
+        combine="by_coords",
+        **kwargs
+):
+    """
+    Opens one or more netCDF files as a single xarray Dataset.
+    Thin wrapper around xr.open_mfdataset that reads data lazily.
+
+    Args:
+        paths : str or list of str
+            File path, glob pattern, or list of file paths to open.
+            A single path may also be a Zarr store (ending in .zarr).
+
+    Keyword Args (optional):
+        chunks : int, dict, "auto", or None
+            Dask chunk sizes.  The default ("auto") follows the
+            on-disk chunk layout, so that subsetting the data only
+            reads the chunks that are needed.  Set chunks=None to
+            read data without dask (e.g. when only a single slice
+            of a single file is needed).
+            Default value: "auto"
+        parallel : bool
+            Set this to True to open the files concurrently with
+            dask.delayed.
+            Default value: True
+        combine : str
+            How to combine the files into a single Dataset.  The
+            default ("by_coords") orders the files by their
+            coordinate values.
+            Default value: "by_coords"
+        kwargs : dict
+            Other keyword arguments passed to xr.open_mfdataset.
+
+    Returns:
+        dset : xr.Dataset
+            The data contained in the file(s).
+    """
+    # Use an HDF5 chunk cache that can hold a few chunks of a
+    # GEOS-Chem 4-D field, so that compressed chunks are not read
+    # and decompressed again for each slice.  netCDF-C sets the
+    # cache of each variable when the file is opened, so only
+    # change the (process-wide) default while opening the files,
+    # and never make it smaller than what the caller has set.
+    chunk_cache = None
+    if kwargs.get("engine") in (None, "netcdf4"):
+        chunk_cache = netCDF4.get_chunk_cache()
+        if chunk_cache[0] < CHUNK_CACHE_SIZE:
+            netCDF4.set_chunk_cache(
+                size=CHUNK_CACHE_SIZE,
+                nelems=CHUNK_CACHE_NELEMS
+            )
+
+    try:
+        if isinstance(paths, (list, tuple)) and len(paths) == 1:
+            paths = paths[0]
+
+        # A single file does not need to be combined with anything,
+        # so skip the overhead of open_mfdataset and open it directly.
+        if isinstance(paths, (str, os.PathLike)) and \
+           not has_magic(str(paths)):
+            preprocess = kwargs.pop("preprocess", None)
+            for key in ("concat_dim", "compat", "data_vars", "coords",
+                        "join", "attrs_file", "combine_attrs"):
+                kwargs.pop(key, None)
+            opener = _DATASET_OPENERS.get(
+                os.path.splitext(str(paths).rstrip(os.sep))[1],
+                xr.open_dataset
+            )
+            dset = opener(paths, chunks=chunks, **kwargs)
+            if preprocess is not None:
+                dset = preprocess(dset)
+            return dset
+
+        return xr.open_mfdataset(
+            paths,
+            chunks=chunks,
+            parallel=parallel,
+            combine=combine,
+            **kwargs
+        )
+    finally:
+        if chunk_cache is not None:
+            netCDF4.set_chunk_cache(*chunk_cache)
+
+
 def dataset_reader(
         multi_files,
         verbose=False
@@ -1964,10 +2139,10 @@ def dataset_reader(
             Default value: False
 
     Returns:
-         reader : either xr.open_mfdataset or xr.open_dataset
+         reader : either open_mfdataset or xr.open_dataset
     """
     if multi_files:
-        reader = xr.open_mfdataset
+        reader = open_mfdataset
         if verbose:
             print('Reading data via xarray open_mfdataset\n')
     else:
@@ -1992,6 +2167,56 @@ def read_config_file(config_file, quiet=False):
         msg = f"Error reading configuration in {config_file}: {err}"
         raise Exception(msg) from err
 
+
+@lru_cache(maxsize=4)
+def read_species_database(spcdb_dir):
+    """
+    Reads the species_database.yml file in a given folder.
+
+    The file is parsed only once per folder (using the LibYAML
+    C parser if available) and the result is cached.  The returned
+    dict is shared between callers, so it should not be modified.
+
+    Args:
+        spcdb_dir: str
+            Folder containing the species_database.yml file.
+
+    Returns:
+        spcdb: dict
+            Species properties (e.g. molecular weights) by species name.
+    """
+    spcdb_file = os.path.join(spcdb_dir, "species_database.yml")
+    try:
+        with open(spcdb_file, encoding=ENCODING) as stream:
+            return yaml_load(stream, Loader=SafeLoader)
+    except Exception as err:
+        msg = f"Error reading species database {spcdb_file}: {err}"
+        raise Exception(msg) from err
+
+
+@lru_cache(maxsize=1)
+def read_bpch_to_nc_names():
+    """
+    Reads the bpch_to_nc_names.yml file that is shipped with GCPy.
+
+    The file is parsed only once and the result is cached.  The
+    returned dict is shared between callers, so it should not be
+    modified.
+
+    Returns:
+        names: dict
+            Netcdf name and renaming action (value) for each bpch
+            diagnostic name (key).
+    """
+    return read_config_file(
+        os.path.join(
+            os.path.dirname(__file__),
+            "bpch_to_nc_names.yml"
+        ),
+        quiet=True
+    )
+
+
 def unique_values(
         this_list,
         drop=None,
@@ -2151,6 +2376,42 @@ def array_equals(
     return (not np.abs(devsum - refsum) > dtype(0.0))
 
 
+def same_array_data(
+        refdata,
+        devdata
+):
+    """
+    Tests if two arrays are views of the same data in memory
+    (i.e. same buffer, shape, strides, and type).  This is much
+    cheaper than comparing the arrays element by element, and can
+    be used to detect when Ref and Dev are the same data.
+
+    Args:
+    -----
+    refdata: xarray DataArray or numpy ndarray
+        The first array to be checked.
+    devdata: xarray DataArray or numpy ndarray
+        The second array to be checked.
+
+    Returns:
+    --------
+    True if both arrays view the same data; False if not
+    (or if either array is not held in memory as a numpy ndarray)
+    """
+    if isinstance(refdata, xr.DataArray):
+        refdata = refdata.data
+    if isinstance(devdata, xr.DataArray):
+        devdata = devdata.data
+    if not isinstance(refdata, np.ndarray) or \
+       not isinstance(devdata, np.ndarray):
+        return False
+
+    return refdata.ctypes.data == devdata.ctypes.data and \
+        refdata.shape == devdata.shape and \
+        refdata.strides == devdata.strides and \
+        refdata.dtype == devdata.dtype
+
+
 def make_directory(
         dir_name,
         overwrite